@@ -7,15 +7,176 @@ and ensure proper collaboration between ui-implementer and feature-logic-impleme
 Based on: SYSTEM-ROUTING-LOGIC.md
 """
 
+import functools
+import hashlib
+import mmap
 import os
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Literal
+from typing import Dict, List, Tuple, Optional, Literal, Union
 import re
+import threading
+
+try:
+    # Optional: RE2 DFA engine for scanning api.ts (no backtracking)
+    import re2 as _sig_re_engine
+except ImportError:
+    _sig_re_engine = re
 
 
 RequestType = Literal["full_feature", "ui_only", "backend_only", "modify_existing"]
 AgentType = Literal["ui-implementer", "feature-logic-implementer", "error"]
 
+# Feature paths may be given as str or Path; checks work on os.fspath()
+StrPath = Union[str, "os.PathLike[str]"]
+
+
+# Pattern for extracting the feature name from a request message
+# (e.g. "app/[feature]" or well-known Korean feature names).
+# Alternatives are listed in priority order.
+_FEATURE_RE = re.compile(
+    r"app/(?P<app>[a-z-]+)"
+    r"|(?P<time>시간\s*거래)"
+    r"|(?P<auth>로그인|회원가입|인증)"
+    r"|(?P<profile>프로필|설정)"
+)
+_FEATURE_PRIORITY = {
+    name: priority
+    for priority, name in enumerate(("app", "time", "auth", "profile"))
+}
+
+# Korean feature name -> path-friendly directory name
+_FEATURE_MAP = {
+    "시간 거래": "time-slots",
+    "로그인": "auth",
+    "회원가입": "auth",
+    "인증": "auth",
+    "프로필": "profile",
+    "설정": "settings",
+}
+
+# Keyword categories used by classify_request
+_CLASSIFY_KEYWORDS = {
+    "ui": ("UI", "디자인", "레이아웃", "컴포넌트", "화면", "폼", "페이지"),
+    "backend": (
+        "Supabase", "API", "로직", "데이터베이스", "쿼리",
+        "작동", "연결", "구현", "인증", "서버",
+    ),
+    "modify": ("수정", "추가", "변경", "업데이트"),
+}
+
+# Keywords implying UI changes (needs_ui_changes)
+_UI_CHANGE_KEYWORDS = (
+    "폼", "화면", "디자인", "레이아웃", "버튼",
+    "입력", "표시", "보여", "UI", "컴포넌트",
+)
+
+
+def _compile_keywords(keywords) -> re.Pattern:
+    """Compile keywords into one alternation (longest first, overlapping matches)"""
+    alternation = "|".join(
+        re.escape(kw) for kw in sorted(set(keywords), key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))")
+
+
+_KEYWORD_CATEGORY = {
+    kw: category
+    for category, keywords in _CLASSIFY_KEYWORDS.items()
+    for kw in keywords
+}
+_CLASSIFY_RE = _compile_keywords(_KEYWORD_CATEGORY)
+# Existence check only, so a plain alternation (no overlap lookahead)
+# lets the regex engine use its literal prefix scan
+_UI_CHANGE_RE = re.compile("|".join(map(re.escape, _UI_CHANGE_KEYWORDS)))
+
+
+# Classification depends on the message alone; repeated messages
+# (CLI retries, benchmark loops) skip the keyword scan
+_CLASSIFY_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def _classify_message(message: str) -> RequestType:
+    """Classify message (see AgentRouter.classify_request)"""
+    # Single pass over the message collecting matched categories;
+    # once every category has matched the outcome can no longer change
+    categories = set()
+    for match in _CLASSIFY_RE.finditer(message):
+        categories.add(_KEYWORD_CATEGORY[match.group(1)])
+        if len(categories) == len(_CLASSIFY_KEYWORDS):
+            break
+
+    has_ui = "ui" in categories
+    has_backend = "backend" in categories
+    has_modify = "modify" in categories
+
+    if has_ui and not has_backend and "만" in message:
+        # Explicit "UI만" request
+        return "ui_only"
+    elif has_backend and not has_ui:
+        return "backend_only"
+    elif has_modify:
+        return "modify_existing"
+    else:
+        return "full_feature"
+
+
+# Maximum number of feature directories kept in the filesystem check cache
+_FS_CACHE_SIZE = 1_000_000
+
+# Directories modified more recently than this are not cached, since a
+# change within the same mtime tick would go unnoticed (racy timestamps)
+_FS_CACHE_RACY_NS = 1_000_000_000
+
+# Required marker in api.ts, pre-encoded so the file is never decoded
+_TODO_MARKER = "🔌 INTEGRATION POINT".encode("utf-8")
+
+# api.ts files larger than this are scanned via mmap instead of read()
+_MMAP_THRESHOLD = 1 << 20
+
+# UI territory that feature-logic-implementer may not modify
+_UI_DIRECTORY = "components"
+_UI_FILES = frozenset({"page.tsx", "layout.tsx"})
+
+# Mandatory UI deliverables: (display name, check_existing_files flag)
+_UI_REQUIRED_FILES = (
+    ("types.ts", "types_exists"),
+    ("api.ts", "api_exists"),
+    ("components/", "components_exist"),
+)
+
+# Static parts of the prerequisite / completion error messages
+_PREREQ_ERR_HEADER = (
+    "❌ Cannot run feature-logic-implementer\n\n"
+    "Required files not found:\n"
+)
+_PREREQ_ERR_FOOTER = (
+    "\n\n"
+    "These files must be created by ui-implementer first.\n\n"
+    "Next step:\n"
+    "1. Run ui-implementer to create the UI foundation\n"
+    "2. Then run feature-logic-implementer to add backend logic"
+)
+_COMPLETION_ERR_HEADER = (
+    "❌ Cannot complete ui-implementer task\n\n"
+    "Missing required files:\n"
+)
+_COMPLETION_ERR_CHECKLIST = "\n\nYou must create ALL mandatory files:\n"
+_COMPLETION_ERR_FOOTER = "\n\nPlease create all files before completing."
+
+# Exported async function declarations in api.ts. Explicit ASCII classes
+# instead of \w and \s, whose Unicode meaning differs between re and RE2.
+_SIG_WS = r'[ \t\r\n]'
+_SIG_RE = _sig_re_engine.compile(
+    rf'export{_SIG_WS}+async{_SIG_WS}+function{_SIG_WS}+([A-Za-z0-9_$]+)'
+    rf'{_SIG_WS}*\([^)]*\){_SIG_WS}*:{_SIG_WS}*Promise<[^>]+>'
+)
+
+# Extracted signatures keyed by blake2b digest of the api.ts content
+_SIG_CACHE: Dict[bytes, Dict[str, str]] = {}
+_SIG_CACHE_SIZE = 1_000_000
+
 
 class AgentRouterError(Exception):
     """Base exception for agent routing errors"""
@@ -42,15 +203,40 @@ class AgentRouter:
     Routes requests to appropriate agents and enforces collaboration rules
     """
 
+    __slots__ = (
+        "base_path",
+        "enforce_ui_first",
+        "verify_prerequisites_enabled",
+        "verify_completion_enabled",
+        "prevent_file_conflicts",
+        "allow_manual_override",
+        "_fs_cache",
+    )
+
     def __init__(self, base_path: str = "."):
+        self.reset(base_path)
+
+    def reset(self, base_path: str = "."):
+        """
+        Re-point the router at base_path with default enforcement
+
+        Clears the filesystem check cache, so one router can be reused
+        across project roots instead of being rebuilt.
+
+        Args:
+            base_path: New project root
+        """
         self.base_path = Path(base_path)
-        self.config = {
-            "enforce_ui_first": True,
-            "verify_prerequisites": True,
-            "verify_completion": True,
-            "prevent_file_conflicts": True,
-            "allow_manual_override": False,  # For debugging only
-        }
+
+        # Enforcement flags
+        self.enforce_ui_first = True
+        self.verify_prerequisites_enabled = True
+        self.verify_completion_enabled = True
+        self.prevent_file_conflicts = True
+        self.allow_manual_override = False  # For debugging only
+
+        # os.fspath(feature_path) -> (directory mtime_ns, existence flags)
+        self._fs_cache: Dict[str, Tuple[int, Dict[str, bool]]] = {}
 
     def route_request(self, user_message: str, context: Optional[Dict] = None) -> str:
         """
@@ -68,38 +254,29 @@ class AgentRouter:
         # Step 1: Analyze request type
         request_type = self.classify_request(user_message)
 
-        # Step 2: Check existing files
+        # Step 2: Route requests that never depend on existing files
+        if request_type == "ui_only":
+            # Always UI agent for UI requests
+            return "ui-implementer"
+
+        if request_type == "modify_existing" and self.needs_ui_changes(user_message):
+            # Modification touches the UI
+            return "ui-implementer"
+
+        # Step 3: Check existing files (only needed from here on)
         feature_path = self.extract_feature_path(user_message, context)
-        files_exist = self.check_existing_files(feature_path)
+        ui_complete = self.check_existing_files(feature_path)["ui_complete"]
 
-        # Step 3: Route based on rules
+        # Step 4: Route based on rules
         if request_type == "full_feature":
-            # Full feature needs UI first
-            if not files_exist["ui_complete"]:
-                return "ui-implementer"
-            else:
-                # UI exists, now add backend
-                return "feature-logic-implementer"
-
-        elif request_type == "ui_only":
-            # Always UI agent for UI requests
-            return "ui-implementer"
+            # Full feature needs UI first; once UI exists, add backend
+            return "feature-logic-implementer" if ui_complete else "ui-implementer"
 
-        elif request_type == "backend_only":
-            # Backend needs UI foundation
-            if not files_exist["ui_complete"]:
+        elif request_type in ("backend_only", "modify_existing"):
+            # Backend work needs UI foundation
+            if not ui_complete:
                 return "error:missing_ui_foundation"
-            else:
-                return "feature-logic-implementer"
-
-        elif request_type == "modify_existing":
-            # Check what needs modification
-            if self.needs_ui_changes(user_message):
-                return "ui-implementer"
-            else:
-                if not files_exist["ui_complete"]:
-                    return "error:missing_ui_foundation"
-                return "feature-logic-implementer"
+            return "feature-logic-implementer"
 
         else:
             # Ambiguous, default to UI first
@@ -115,26 +292,7 @@ class AgentRouter:
         Returns:
             Request type classification
         """
-        ui_keywords = ["UI", "디자인", "레이아웃", "컴포넌트", "화면", "폼", "페이지"]
-        backend_keywords = [
-            "Supabase", "API", "로직", "데이터베이스", "쿼리",
-            "작동", "연결", "구현", "인증", "서버"
-        ]
-        modify_keywords = ["수정", "추가", "변경", "업데이트"]
-
-        has_ui = any(kw in message for kw in ui_keywords)
-        has_backend = any(kw in message for kw in backend_keywords)
-        has_modify = any(kw in message for kw in modify_keywords)
-
-        if has_ui and not has_backend and "만" in message:
-            # Explicit "UI만" request
-            return "ui_only"
-        elif has_backend and not has_ui:
-            return "backend_only"
-        elif has_modify:
-            return "modify_existing"
-        else:
-            return "full_feature"
+        return _classify_message(message)
 
     def extract_feature_path(self, message: str, context: Dict) -> Path:
         """
@@ -151,35 +309,26 @@ class AgentRouter:
         if "current_path" in context:
             return Path(context["current_path"])
 
-        # Try to extract from message
-        # Look for patterns like "app/[feature]" or feature names
-        feature_patterns = [
-            r"app/([a-z-]+)",
-            r"(시간\s*거래)",
-            r"(로그인|회원가입|인증)",
-            r"(프로필|설정)",
-        ]
-
-        for pattern in feature_patterns:
-            match = re.search(pattern, message)
-            if match:
-                feature = match.group(1)
-                # Convert Korean to path-friendly name
-                feature_map = {
-                    "시간 거래": "time-slots",
-                    "로그인": "auth",
-                    "회원가입": "auth",
-                    "인증": "auth",
-                    "프로필": "profile",
-                    "설정": "settings",
-                }
-                feature_name = feature_map.get(feature, feature.replace(" ", "-"))
-                return self.base_path / "app" / feature_name
+        # Try to extract from message; an earlier alternative wins over a
+        # leftmost match of a later one
+        best = None
+        for match in _FEATURE_RE.finditer(message):
+            priority = _FEATURE_PRIORITY[match.lastgroup]
+            if best is None or priority < best[0]:
+                best = (priority, match.group(match.lastgroup))
+                if priority == 0:
+                    break
+
+        if best is not None:
+            feature = best[1]
+            # Convert Korean to path-friendly name
+            feature_name = _FEATURE_MAP.get(feature, feature.replace(" ", "-"))
+            return self.base_path / "app" / feature_name
 
         # Default to app root
         return self.base_path / "app"
 
-    def check_existing_files(self, feature_path: Path) -> Dict[str, bool]:
+    def check_existing_files(self, feature_path: StrPath) -> Dict[str, bool]:
         """
         Check what files already exist
 
@@ -189,17 +338,52 @@ class AgentRouter:
         Returns:
             Dictionary with existence flags
         """
-        types_exists = (feature_path / "types.ts").exists()
-        api_exists = (feature_path / "api.ts").exists()
-        components_exist = (feature_path / "components").exists()
-
-        return {
+        path = os.fspath(feature_path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return {
+                "types_exists": False,
+                "api_exists": False,
+                "components_exist": False,
+                "ui_complete": False,
+            }
+
+        # Directory mtime changes whenever an entry is added or removed
+        cached = self._fs_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1].copy()
+
+        # One directory listing instead of an exists() call per file
+        try:
+            with os.scandir(path) as it:
+                entries = {entry.name: entry.is_dir() for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            entries = {}
+
+        types_exists = "types.ts" in entries
+        api_exists = "api.ts" in entries
+        components_exist = entries.get("components", False)
+
+        files = {
             "types_exists": types_exists,
             "api_exists": api_exists,
             "components_exist": components_exist,
             "ui_complete": types_exists and api_exists and components_exist,
         }
 
+        if time.time_ns() - mtime_ns > _FS_CACHE_RACY_NS:
+            if len(self._fs_cache) >= _FS_CACHE_SIZE:
+                # Evict oldest entry (dicts preserve insertion order)
+                del self._fs_cache[next(iter(self._fs_cache))]
+            self._fs_cache[path] = (mtime_ns, files.copy())
+
+        return files
+
+    def _invalidate_fs_cache(self, file_path: StrPath) -> None:
+        """Drop cached existence flags for the directory containing file_path"""
+        self._fs_cache.pop(os.path.dirname(os.fspath(file_path)), None)
+
     def needs_ui_changes(self, message: str) -> bool:
         """
         Determine if message implies UI changes are needed
@@ -210,52 +394,46 @@ class AgentRouter:
         Returns:
             True if UI changes needed
         """
-        ui_change_keywords = [
-            "폼", "화면", "디자인", "레이아웃", "버튼",
-            "입력", "표시", "보여", "UI", "컴포넌트"
-        ]
+        return _UI_CHANGE_RE.search(message) is not None
 
-        return any(kw in message for kw in ui_change_keywords)
-
-    def verify_prerequisites(self, agent: str, feature_path: Path) -> Tuple[bool, str]:
+    def verify_prerequisites(
+        self,
+        agent: str,
+        feature_path: StrPath,
+        files: Optional[Dict[str, bool]] = None,
+    ) -> Tuple[bool, str]:
         """
         Verify agent can run
 
         Args:
             agent: Agent name
             feature_path: Path to feature directory
+            files: Result of check_existing_files(feature_path), if the
+                caller already has it
 
         Returns:
             (can_run, error_message)
         """
-        if not self.config["verify_prerequisites"]:
+        if not self.verify_prerequisites_enabled:
             return (True, "")
 
         if agent == "feature-logic-implementer":
-            files = self.check_existing_files(feature_path)
+            if files is None:
+                files = self.check_existing_files(feature_path)
             if not files["ui_complete"]:
-                missing = []
-                if not files["types_exists"]:
-                    missing.append("types.ts")
-                if not files["api_exists"]:
-                    missing.append("api.ts")
-                if not files["components_exist"]:
-                    missing.append("components/")
-
+                missing = tuple(
+                    name for name, key in _UI_REQUIRED_FILES if not files[key]
+                )
                 error_msg = (
-                    f"❌ Cannot run feature-logic-implementer\n\n"
-                    f"Required files not found:\n"
-                    f"{chr(10).join('- ' + str(feature_path / m) for m in missing)}\n\n"
-                    f"These files must be created by ui-implementer first.\n\n"
-                    f"Next step:\n"
-                    f"1. Run ui-implementer to create the UI foundation\n"
-                    f"2. Then run feature-logic-implementer to add backend logic"
+                    _PREREQ_ERR_HEADER
+                    + "\n".join(f"- {Path(feature_path) / m}" for m in missing)
+                    + _PREREQ_ERR_FOOTER
                 )
                 return (False, error_msg)
 
         return (True, "")
 
-    def verify_completion(self, agent: str, feature_path: Path) -> Tuple[bool, str]:
+    def verify_completion(self, agent: str, feature_path: StrPath) -> Tuple[bool, str]:
         """
         Verify agent completed required tasks
 
@@ -266,27 +444,27 @@ class AgentRouter:
         Returns:
             (is_complete, error_message)
         """
-        if not self.config["verify_completion"]:
+        if not self.verify_completion_enabled:
             return (True, "")
 
         if agent == "ui-implementer":
             is_complete, missing = self._verify_ui_completion(feature_path)
             if not is_complete:
                 error_msg = (
-                    f"❌ Cannot complete ui-implementer task\n\n"
-                    f"Missing required files:\n"
-                    f"{chr(10).join('- ' + m for m in missing)}\n\n"
-                    f"You must create ALL mandatory files:\n"
-                    f"1. types.ts {'✓' if (feature_path / 'types.ts').exists() else '✗ (MISSING)'}\n"
-                    f"2. api.ts {'✓' if (feature_path / 'api.ts').exists() else '✗ (MISSING)'}\n"
-                    f"3. components/ {'✓' if (feature_path / 'components').exists() else '✗ (MISSING)'}\n\n"
-                    f"Please create all files before completing."
+                    _COMPLETION_ERR_HEADER
+                    + "\n".join(f"- {m}" for m in missing)
+                    + _COMPLETION_ERR_CHECKLIST
+                    + "\n".join(
+                        f"{i}. {name} {'✗ (MISSING)' if name in missing else '✓'}"
+                        for i, (name, _) in enumerate(_UI_REQUIRED_FILES, 1)
+                    )
+                    + _COMPLETION_ERR_FOOTER
                 )
                 return (False, error_msg)
 
         return (True, "")
 
-    def _verify_ui_completion(self, feature_path: Path) -> Tuple[bool, List[str]]:
+    def _verify_ui_completion(self, feature_path: StrPath) -> Tuple[bool, List[str]]:
         """
         Verify UI agent created all mandatory files
 
@@ -297,24 +475,42 @@ class AgentRouter:
             (is_complete, missing_files)
         """
         missing = []
+        # Shares the mtime-validated listing cache with prerequisite checks
+        files = self.check_existing_files(feature_path)
 
-        if not (feature_path / "types.ts").exists():
+        if not files["types_exists"]:
             missing.append("types.ts")
 
-        if not (feature_path / "api.ts").exists():
+        if not files["api_exists"]:
             missing.append("api.ts")
         else:
             # Verify api.ts has TODO markers
-            content = (feature_path / "api.ts").read_text(encoding='utf-8')
-            if "🔌 INTEGRATION POINT" not in content:
+            if not self._has_todo_marker(os.path.join(os.fspath(feature_path), "api.ts")):
                 missing.append("api.ts (missing TODO markers)")
 
-        if not (feature_path / "components").exists():
+        if not files["components_exist"]:
             missing.append("components/")
 
         return (len(missing) == 0, missing)
 
-    def before_create_file(self, agent: str, file_path: Path) -> None:
+    def _has_todo_marker(self, api_file: StrPath) -> bool:
+        """
+        Check api.ts for the integration TODO marker without decoding it
+
+        Args:
+            api_file: Path to api.ts
+
+        Returns:
+            True if the marker is present
+        """
+        with open(api_file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return content.find(_TODO_MARKER) != -1
+            return _TODO_MARKER in f.read()
+
+    def before_create_file(self, agent: str, file_path: StrPath) -> None:
         """
         Prevent duplicate file creation
 
@@ -325,24 +521,26 @@ class AgentRouter:
         Raises:
             ForbiddenOperationError: If operation is forbidden
         """
-        if not self.config["prevent_file_conflicts"]:
-            return
+        self._invalidate_fs_cache(file_path)
 
-        if str(file_path).endswith("api.ts"):
-            if file_path.exists():
-                if agent == "feature-logic-implementer":
-                    raise ForbiddenOperationError(
-                        f"FORBIDDEN: feature-logic-implementer cannot create {file_path}. "
-                        f"This file already exists and should only be modified, not replaced."
-                    )
+        # Only feature-logic-implementer is restricted, so other agents
+        # skip the string checks and the stat
+        if not self.prevent_file_conflicts or agent != "feature-logic-implementer":
+            return
 
-        if str(file_path).endswith("types.ts"):
-            if file_path.exists():
-                if agent == "feature-logic-implementer":
-                    # Allow extending, but warn
-                    print(f"⚠️  WARNING: Extending existing {file_path}. Do not delete existing types.")
+        path = os.fspath(file_path)
+        if path.endswith("api.ts"):
+            if os.path.exists(path):
+                raise ForbiddenOperationError(
+                    f"FORBIDDEN: feature-logic-implementer cannot create {file_path}. "
+                    f"This file already exists and should only be modified, not replaced."
+                )
+        elif path.endswith("types.ts"):
+            if os.path.exists(path):
+                # Allow extending, but warn
+                print(f"⚠️  WARNING: Extending existing {file_path}. Do not delete existing types.")
 
-    def before_modify_file(self, agent: str, file_path: Path) -> None:
+    def before_modify_file(self, agent: str, file_path: StrPath) -> None:
         """
         Prevent backend agent from touching UI files
 
@@ -353,18 +551,19 @@ class AgentRouter:
         Raises:
             ForbiddenOperationError: If operation is forbidden
         """
-        if not self.config["prevent_file_conflicts"]:
-            return
+        self._invalidate_fs_cache(file_path)
 
-        ui_directories = ["/components/", "/page.tsx", "/layout.tsx"]
+        if not self.prevent_file_conflicts:
+            return
 
         if agent == "feature-logic-implementer":
-            for ui_dir in ui_directories:
-                if ui_dir in str(file_path).replace("\\", "/"):
-                    raise ForbiddenOperationError(
-                        f"FORBIDDEN: feature-logic-implementer cannot modify {file_path}. "
-                        f"This is UI territory. Request ui-implementer to make changes."
-                    )
+            # Normalize Windows separators once, then check path components
+            *dirs, name = os.fspath(file_path).replace("\\", "/").split("/")
+            if name in _UI_FILES or _UI_DIRECTORY in dirs:
+                raise ForbiddenOperationError(
+                    f"FORBIDDEN: feature-logic-implementer cannot modify {file_path}. "
+                    f"This is UI territory. Request ui-implementer to make changes."
+                )
 
     def verify_api_signature_unchanged(
         self,
@@ -381,7 +580,11 @@ class AgentRouter:
         Raises:
             ForbiddenOperationError: If signatures were changed
         """
-        if not self.config["prevent_file_conflicts"]:
+        if not self.prevent_file_conflicts:
+            return
+
+        # Identical content cannot have changed signatures
+        if original_api == modified_api:
             return
 
         original_sigs = self._extract_function_signatures(original_api)
@@ -411,70 +614,109 @@ class AgentRouter:
         Returns:
             Dictionary of function_name -> signature
         """
+        key = hashlib.blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        cached = _SIG_CACHE.get(key)
+        if cached is not None:
+            return dict(cached)
+
         signatures = {}
 
         # Match export async function declarations
-        pattern = r'export\s+async\s+function\s+(\w+)\s*\([^)]*\)\s*:\s*Promise<[^>]+>'
-
-        for match in re.finditer(pattern, content):
+        for match in _SIG_RE.finditer(content):
             func_name = match.group(1)
             signature = match.group(0)
             signatures[func_name] = signature
 
-        return signatures
+        if len(_SIG_CACHE) >= _SIG_CACHE_SIZE:
+            # Evict oldest entry (dicts preserve insertion order)
+            del _SIG_CACHE[next(iter(_SIG_CACHE))]
+        _SIG_CACHE[key] = signatures
+
+        return dict(signatures)
 
 
 class RoutingMetrics:
     """
-    Track routing metrics for monitoring
+    Track routing metrics for monitoring (safe to share across threads)
     """
 
+    _COUNTERS = (
+        "total_requests",
+        "routed_to_ui",
+        "routed_to_backend",
+        "blocked_missing_prerequisites",
+        "blocked_incomplete_ui",
+        "blocked_file_conflicts",
+        "successful_collaborations",
+    )
+
+    __slots__ = _COUNTERS + ("_lock",)
+
     def __init__(self):
-        self.metrics = {
-            "total_requests": 0,
-            "routed_to_ui": 0,
-            "routed_to_backend": 0,
-            "blocked_missing_prerequisites": 0,
-            "blocked_incomplete_ui": 0,
-            "blocked_file_conflicts": 0,
-            "successful_collaborations": 0,
-        }
+        for name in self._COUNTERS:
+            setattr(self, name, 0)
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Current metrics as a dictionary (snapshot)"""
+        return self.get_metrics()
 
     def record_route(self, agent: str) -> None:
         """Record successful routing"""
-        self.metrics["total_requests"] += 1
-        if agent == "ui-implementer":
-            self.metrics["routed_to_ui"] += 1
-        elif agent == "feature-logic-implementer":
-            self.metrics["routed_to_backend"] += 1
+        with self._lock:
+            self.total_requests += 1
+            if agent == "ui-implementer":
+                self.routed_to_ui += 1
+            elif agent == "feature-logic-implementer":
+                self.routed_to_backend += 1
 
     def record_block(self, reason: str) -> None:
         """Record blocked operation"""
-        if reason == "missing_prerequisites":
-            self.metrics["blocked_missing_prerequisites"] += 1
-        elif reason == "incomplete_ui":
-            self.metrics["blocked_incomplete_ui"] += 1
-        elif reason == "file_conflicts":
-            self.metrics["blocked_file_conflicts"] += 1
+        with self._lock:
+            if reason == "missing_prerequisites":
+                self.blocked_missing_prerequisites += 1
+            elif reason == "incomplete_ui":
+                self.blocked_incomplete_ui += 1
+            elif reason == "file_conflicts":
+                self.blocked_file_conflicts += 1
 
     def record_success(self) -> None:
         """Record successful collaboration"""
-        self.metrics["successful_collaborations"] += 1
+        with self._lock:
+            self.successful_collaborations += 1
 
     def get_metrics(self) -> Dict[str, int]:
         """Get current metrics"""
-        return self.metrics.copy()
+        with self._lock:
+            return {name: getattr(self, name) for name in self._COUNTERS}
 
     def get_success_rate(self) -> float:
         """Calculate success rate (blocked should be near zero)"""
-        total_blocked = (
-            self.metrics["blocked_missing_prerequisites"] +
-            self.metrics["blocked_incomplete_ui"] +
-            self.metrics["blocked_file_conflicts"]
-        )
-        total = self.metrics["total_requests"]
+        return self._success_rate(self.get_metrics())
+
+    def snapshot(self) -> Tuple[Dict[str, int], float]:
+        """
+        Get metrics and success rate from one consistent read
+
+        Returns:
+            (metrics, success_rate)
+        """
+        metrics = self.get_metrics()
+        return metrics, self._success_rate(metrics)
 
+    @staticmethod
+    def _success_rate(metrics: Dict[str, int]) -> float:
+        """Success rate for a metrics dictionary"""
+        total = metrics["total_requests"]
         if total == 0:
             return 1.0
 
+        total_blocked = (
+            metrics["blocked_missing_prerequisites"] +
+            metrics["blocked_incomplete_ui"] +
+            metrics["blocked_file_conflicts"]
+        )
         return 1.0 - (total_blocked / total)
@@ -4,7 +4,8 @@ API Interface for Agent Orchestration System
 Provides REST API endpoints for agent routing and execution.
 
 Installation:
-    pip install fastapi uvicorn pydantic
+    pip install fastapi uvicorn pydantic orjson
+    pip install uvloop httptools  # optional, faster event loop and HTTP parser
 
 Usage:
     uvicorn api_interface:app --reload --port 8000
@@ -15,14 +16,20 @@ API Documentation:
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List, Any
 from pathlib import Path
+from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from main import AgentOrchestrator, ExecutionResult, AgentStatus
 
 
+log = logging.getLogger(__name__)
+
+
 # Pydantic models for request/response
 class ProcessRequest(BaseModel):
     """Request to process user message"""
@@ -103,11 +110,36 @@ class FileOperationResponse(BaseModel):
     error: Optional[str] = None
 
 
+# Global orchestrator instance
+orchestrator: Optional[AgentOrchestrator] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize orchestrator before serving and export history on shutdown"""
+    global orchestrator
+    orchestrator = AgentOrchestrator(
+        base_path=".",
+        log_level=logging.INFO,
+    )
+    log.info("Agent Orchestrator initialized")
+
+    yield
+
+    # Export history before shutdown
+    history_file = Path("agent_history.json")
+    orchestrator.export_history(history_file)
+    log.info("History exported to %s", history_file)
+    orchestrator.shutdown()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Agent Orchestration API",
     description="API for routing and managing UI and Logic implementation agents",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -119,31 +151,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global orchestrator instance
-orchestrator: Optional[AgentOrchestrator] = None
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize orchestrator on startup"""
-    global orchestrator
-    orchestrator = AgentOrchestrator(
-        base_path=".",
-        log_level=logging.INFO,
-    )
-    logging.info("Agent Orchestrator initialized")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    global orchestrator
-    if orchestrator:
-        # Export history before shutdown
-        history_file = Path("agent_history.json")
-        orchestrator.export_history(history_file)
-        logging.info(f"History exported to {history_file}")
-
 
 @app.get("/", response_model=HealthResponse)
 async def health_check():
@@ -174,14 +181,8 @@ async def process_request(request: ProcessRequest):
     Raises:
         HTTPException: If processing fails
     """
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not initialized"
-        )
-
     try:
-        result = orchestrator.process_request(
+        result = await orchestrator.process_request_async(
             request.message,
             request.context,
         )
@@ -197,7 +198,7 @@ async def process_request(request: ProcessRequest):
         )
 
     except Exception as e:
-        logging.error(f"Error processing request: {e}", exc_info=True)
+        log.error("Error processing request: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -218,18 +219,11 @@ async def verify_completion(request: VerifyCompletionRequest):
     Raises:
         HTTPException: If verification fails
     """
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not initialized"
-        )
-
     try:
-        feature_path = Path(request.feature_path)
-
-        result = orchestrator.verify_agent_completion(
+        result = await asyncio.to_thread(
+            orchestrator.verify_agent_completion,
             request.agent,
-            feature_path,
+            request.feature_path,
         )
 
         return ExecutionResponse(
@@ -243,7 +237,7 @@ async def verify_completion(request: VerifyCompletionRequest):
         )
 
     except Exception as e:
-        logging.error(f"Error verifying completion: {e}", exc_info=True)
+        log.error("Error verifying completion: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -264,19 +258,12 @@ async def check_file_operation(request: CheckFileOperationRequest):
     Raises:
         HTTPException: If check fails
     """
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not initialized"
-        )
-
     try:
-        file_path = Path(request.file_path)
-
-        error = orchestrator.check_file_operation(
+        error = await asyncio.to_thread(
+            orchestrator.check_file_operation,
             request.agent,
             request.operation,
-            file_path,
+            request.file_path,
         )
 
         return FileOperationResponse(
@@ -285,14 +272,16 @@ async def check_file_operation(request: CheckFileOperationRequest):
         )
 
     except Exception as e:
-        logging.error(f"Error checking file operation: {e}", exc_info=True)
+        log.error("Error checking file operation: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
 
 
-@app.get("/metrics", response_model=MetricsResponse)
+# MetricsResponse only documents the schema: the payload is built by the
+# orchestrator, so it is returned without response-model validation
+@app.get("/metrics", responses={200: {"model": MetricsResponse}})
 async def get_metrics():
     """
     Get system metrics
@@ -303,24 +292,12 @@ async def get_metrics():
     Raises:
         HTTPException: If retrieval fails
     """
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not initialized"
-        )
-
     try:
-        metrics_data = orchestrator.get_metrics()
-
-        return MetricsResponse(
-            metrics=metrics_data["metrics"],
-            success_rate=metrics_data["success_rate"],
-            total_executions=metrics_data["total_executions"],
-            history=metrics_data["history"],
-        )
+        metrics_data = await asyncio.to_thread(orchestrator.get_metrics)
+        return ORJSONResponse(metrics_data)
 
     except Exception as e:
-        logging.error(f"Error getting metrics: {e}", exc_info=True)
+        log.error("Error getting metrics: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -338,18 +315,13 @@ async def get_history():
     Raises:
         HTTPException: If retrieval fails
     """
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not initialized"
-        )
-
     try:
-        history = orchestrator.export_history()
-        return {"history": history}
+        # Serializing the history is CPU-bound; keep it off the event loop
+        history = await asyncio.to_thread(orchestrator.export_history)
+        return ORJSONResponse({"history": history})
 
     except Exception as e:
-        logging.error(f"Error getting history: {e}", exc_info=True)
+        log.error("Error getting history: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -402,6 +374,8 @@ async def example_full_feature():
 if __name__ == "__main__":
     import uvicorn
 
+    # uvicorn's default loop="auto" / http="auto" already picks uvloop and
+    # httptools when installed (uvicorn[standard] in requirements.txt)
     uvicorn.run(
         "api_interface:app",
         host="0.0.0.0",
@@ -4,7 +4,7 @@ CLI Interface for Agent Orchestration System
 Provides command-line interface for agent routing and execution.
 
 Installation:
-    pip install click rich
+    pip install click rich orjson
 
 Usage:
     python cli_interface.py process "시간 거래 기능 만들어줘"
@@ -13,19 +13,155 @@ Usage:
 """
 
 import click
+import contextlib
+import functools
+import sys
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich import box
-import json
+from typing import TYPE_CHECKING
+from datetime import datetime
+from enum import Enum
+import orjson
 
-from main import AgentOrchestrator, AgentStatus
+# rich and main are imported where needed so that --help and
+# examples start without loading them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from main import AgentOrchestrator
 
 
-# Rich console for pretty output
-console = Console()
+# AgentStatus value -> (color, icon); keyed by value so main stays lazy
+_STATUS_STYLE = {
+    "completed": ("green", "✅"),
+    "running": ("blue", "▶️"),
+    "blocked": ("yellow", "⚠️"),
+    "failed": ("red", "❌"),
+}
+_DEFAULT_STATUS_STYLE = ("white", "ℹ️")
+
+
+class FastChoice(click.Choice):
+    """click.Choice with an O(1) exact-match fast path"""
+
+    def __init__(self, choices):
+        super().__init__(choices)
+        self._choice_set = frozenset(choices)
+
+    def convert(self, value, param, ctx):
+        if value in self._choice_set:
+            return value
+        # Fall back to click for normalization and error reporting
+        return super().convert(value, param, ctx)
+
+
+_AGENT_CHOICE = FastChoice(('ui-implementer', 'feature-logic-implementer'))
+_OPERATION_CHOICE = FastChoice(('create', 'modify'))
+_HISTORY_FORMAT_CHOICE = FastChoice(('json', 'ndjson'))
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Rich console for pretty output (created on first use)"""
+    from rich.console import Console
+    return Console()
+
+
+def _get_orchestrator(ctx) -> "AgentOrchestrator":
+    """Get the orchestrator, creating it on first use"""
+    future = ctx.obj.pop('orchestrator_future', None)
+    if future is not None:
+        ctx.obj['orchestrator'] = future.result()
+    if ctx.obj.get('orchestrator') is None:
+        from main import AgentOrchestrator
+        ctx.obj['orchestrator'] = AgentOrchestrator(base_path=".")
+    return ctx.obj['orchestrator']
+
+
+def _preload_orchestrator(ctx) -> None:
+    """Start building the orchestrator on a background thread
+
+    _get_orchestrator() reaps the result, blocking only if init
+    has not finished yet.
+    """
+    if ctx.obj.get('orchestrator') is not None or 'orchestrator_future' in ctx.obj:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    def build():
+        from main import AgentOrchestrator
+        return AgentOrchestrator(base_path=".")
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    ctx.obj['orchestrator_future'] = executor.submit(build)
+    executor.shutdown(wait=False)
+
+
+def _json_default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_bytes(obj) -> bytes:
+    """Serialize to indented JSON bytes"""
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def _dumps(obj) -> str:
+    """Serialize to indented JSON text"""
+    return _dumps_bytes(obj).decode()
+
+
+def _emit_json(obj) -> None:
+    """
+    Print obj as JSON
+
+    Terminals get syntax highlighting from the already-serialized text
+    (no re-parse as with print_json); pipes get the raw bytes.
+    """
+    console = _console()
+    if not console.is_terminal:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_dumps_bytes(obj) + b"\n")
+        sys.stdout.buffer.flush()
+        return
+
+    from rich.syntax import Syntax
+    console.print(Syntax(_dumps(obj), "json", theme="ansi_dark", word_wrap=True))
+
+
+def _maybe_progress(description: str, enabled: bool = True):
+    """
+    Spinner while work runs, or a no-op when it would not be visible
+
+    Args:
+        description: Spinner text
+        enabled: False to skip the spinner (e.g. JSON output)
+
+    Returns:
+        Context manager
+    """
+    console = _console()
+    if not (enabled and console.is_terminal):
+        return contextlib.nullcontext()
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+    progress.add_task(description=description, total=None)
+    return progress
 
 
 @click.group()
@@ -36,9 +172,8 @@ def cli(ctx):
 
     Manages routing and execution of UI and Logic implementation agents.
     """
-    # Initialize orchestrator
+    # Orchestrator is created lazily by commands that need it
     ctx.ensure_object(dict)
-    ctx.obj['orchestrator'] = AgentOrchestrator(base_path=".")
 
 
 @cli.command()
@@ -54,31 +189,25 @@ def process(ctx, message: str, path: str, json_output: bool):
         cli_interface.py process "시간 거래 기능 만들어줘"
         cli_interface.py process "Supabase 연결해줘" --path app/time-slots
     """
-    orchestrator: AgentOrchestrator = ctx.obj['orchestrator']
+    orchestrator = _get_orchestrator(ctx)
 
     context = {}
     if path:
         context['current_path'] = path
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task(description="Processing request...", total=None)
-
+    with _maybe_progress("Processing request...", enabled=not json_output):
         result = orchestrator.process_request(message, context)
 
     if json_output:
         # JSON output
-        console.print_json(json.dumps(result.to_dict(), indent=2))
+        _emit_json(result.to_dict())
     else:
         # Pretty output
         _display_execution_result(result)
 
 
 @cli.command()
-@click.argument('agent', type=click.Choice(['ui-implementer', 'feature-logic-implementer']))
+@click.argument('agent', type=_AGENT_CHOICE)
 @click.argument('feature_path')
 @click.option('--json-output', '-j', is_flag=True, help='Output as JSON')
 @click.pass_context
@@ -90,28 +219,20 @@ def verify(ctx, agent: str, feature_path: str, json_output: bool):
         cli_interface.py verify ui-implementer app/time-slots
         cli_interface.py verify feature-logic-implementer app/auth
     """
-    orchestrator: AgentOrchestrator = ctx.obj['orchestrator']
-
-    feature_path_obj = Path(feature_path)
+    orchestrator = _get_orchestrator(ctx)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task(description="Verifying completion...", total=None)
-
-        result = orchestrator.verify_agent_completion(agent, feature_path_obj)
+    with _maybe_progress("Verifying completion...", enabled=not json_output):
+        result = orchestrator.verify_agent_completion(agent, feature_path)
 
     if json_output:
-        console.print_json(json.dumps(result.to_dict(), indent=2))
+        _emit_json(result.to_dict())
     else:
         _display_execution_result(result)
 
 
 @cli.command()
 @click.argument('agent')
-@click.argument('operation', type=click.Choice(['create', 'modify']))
+@click.argument('operation', type=_OPERATION_CHOICE)
 @click.argument('file_path')
 @click.pass_context
 def check(ctx, agent: str, operation: str, file_path: str):
@@ -122,11 +243,12 @@ def check(ctx, agent: str, operation: str, file_path: str):
         cli_interface.py check feature-logic-implementer create app/time-slots/api.ts
         cli_interface.py check feature-logic-implementer modify app/time-slots/components/Form.tsx
     """
-    orchestrator: AgentOrchestrator = ctx.obj['orchestrator']
+    from rich.panel import Panel
 
-    file_path_obj = Path(file_path)
+    console = _console()
+    orchestrator = _get_orchestrator(ctx)
 
-    error = orchestrator.check_file_operation(agent, operation, file_path_obj)
+    error = orchestrator.check_file_operation(agent, operation, file_path)
 
     if error is None:
         console.print(Panel(
@@ -157,37 +279,44 @@ def metrics(ctx, json_output: bool):
         cli_interface.py metrics
         cli_interface.py metrics --json-output
     """
-    orchestrator: AgentOrchestrator = ctx.obj['orchestrator']
+    orchestrator = _get_orchestrator(ctx)
 
     metrics_data = orchestrator.get_metrics()
 
     if json_output:
-        console.print_json(json.dumps(metrics_data, indent=2))
+        _emit_json(metrics_data)
     else:
         _display_metrics(metrics_data)
 
 
 @cli.command()
 @click.option('--output', '-o', help='Output file path')
+@click.option('--format', '-f', 'fmt', type=_HISTORY_FORMAT_CHOICE,
+              help='Output format (default: ndjson for .ndjson files, else json)')
 @click.pass_context
-def history(ctx, output: str):
+def history(ctx, output: str, fmt: str):
     """
     Export execution history
 
     Examples:
         cli_interface.py history
         cli_interface.py history --output history.json
+        cli_interface.py history --output history.ndjson
+        cli_interface.py history --format ndjson
     """
-    orchestrator: AgentOrchestrator = ctx.obj['orchestrator']
-
-    output_file = Path(output) if output else None
-
-    history_json = orchestrator.export_history(output_file)
+    console = _console()
+    orchestrator = _get_orchestrator(ctx)
 
     if output:
+        orchestrator.export_history(Path(output), fmt)
         console.print(f"[green]✅ History exported to {output}[/green]")
-    else:
-        console.print_json(history_json)
+        return
+
+    if fmt == 'ndjson':
+        click.echo(orchestrator.export_history(fmt='ndjson'), nl=False)
+        return
+
+    _emit_json(orchestrator.get_history_data())
 
 
 @cli.command()
@@ -195,6 +324,10 @@ def examples():
     """
     Show example commands
     """
+    from rich.panel import Panel
+
+    console = _console()
+
     examples_text = """
 [bold cyan]Example Commands:[/bold cyan]
 
@@ -221,6 +354,7 @@ def examples():
 
 [yellow]8. Export history:[/yellow]
    python cli_interface.py history --output history.json
+   python cli_interface.py history --output history.ndjson
 """
     console.print(Panel(examples_text, title="Examples", border_style="cyan"))
 
@@ -231,7 +365,10 @@ def interactive(ctx):
     """
     Start interactive mode
     """
-    orchestrator: AgentOrchestrator = ctx.obj['orchestrator']
+    _preload_orchestrator(ctx)
+    from rich.panel import Panel
+
+    console = _console()
 
     console.print(Panel(
         "[bold cyan]Agent Orchestration System - Interactive Mode[/bold cyan]\n\n"
@@ -243,28 +380,49 @@ def interactive(ctx):
         "Or just type your feature request!",
         border_style="cyan",
     ))
+    orchestrator = _get_orchestrator(ctx)
 
     while True:
         try:
             user_input = console.input("\n[bold cyan]>[/bold cyan] ")
 
-            if not user_input.strip():
+            command = user_input.strip().lower()
+
+            if not command:
                 continue
 
-            if user_input.lower() == 'exit':
+            if command == 'exit':
                 console.print("[yellow]Exiting interactive mode...[/yellow]")
                 break
 
-            elif user_input.lower() == 'metrics':
-                metrics_data = orchestrator.get_metrics()
-                _display_metrics(metrics_data)
+            handler = _INTERACTIVE_COMMANDS.get(command)
+            if handler is not None:
+                handler(orchestrator)
+            else:
+                # Process as request
+                result = orchestrator.process_request(user_input, {})
+                _display_execution_result(result)
+
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Exiting interactive mode...[/yellow]")
+            break
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+
+
+def _interactive_metrics(orchestrator):
+    """Interactive 'metrics' command"""
+    _display_metrics(orchestrator.get_metrics())
 
-            elif user_input.lower() == 'history':
-                history_json = orchestrator.export_history()
-                console.print_json(history_json)
 
-            elif user_input.lower() == 'help':
-                console.print("""
+def _interactive_history(orchestrator):
+    """Interactive 'history' command"""
+    _emit_json(orchestrator.get_history_data())
+
+
+def _interactive_help(orchestrator):
+    """Interactive 'help' command"""
+    _console().print("""
 [bold cyan]Available commands:[/bold cyan]
   metrics  - Show system metrics
   history  - Show execution history
@@ -276,37 +434,24 @@ Or type a feature request like:
   "Supabase 연결해줘"
 """)
 
-            else:
-                # Process as request
-                result = orchestrator.process_request(user_input, {})
-                _display_execution_result(result)
 
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Exiting interactive mode...[/yellow]")
-            break
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
+# Interactive mode commands (besides 'exit')
+_INTERACTIVE_COMMANDS = {
+    'metrics': _interactive_metrics,
+    'history': _interactive_history,
+    'help': _interactive_help,
+}
 
 
 def _display_execution_result(result):
     """Display execution result in pretty format"""
+    from rich.panel import Panel
+    from rich import box
+
+    console = _console()
 
     # Determine color based on status
-    if result.status == AgentStatus.COMPLETED:
-        color = "green"
-        icon = "✅"
-    elif result.status == AgentStatus.RUNNING:
-        color = "blue"
-        icon = "▶️"
-    elif result.status == AgentStatus.BLOCKED:
-        color = "yellow"
-        icon = "⚠️"
-    elif result.status == AgentStatus.FAILED:
-        color = "red"
-        icon = "❌"
-    else:
-        color = "white"
-        icon = "ℹ️"
+    color, icon = _STATUS_STYLE.get(result.status.value, _DEFAULT_STATUS_STYLE)
 
     # Create panel content
     content = f"{icon} [bold]{result.status.value.upper()}[/bold]\n\n"
@@ -333,8 +478,29 @@ def _display_execution_result(result):
     ))
 
 
+# Rows of the metrics table: sections of (label, metrics key)
+_METRIC_SECTIONS = (
+    (
+        ("Total Requests", 'total_requests'),
+        ("Routed to UI", 'routed_to_ui'),
+        ("Routed to Backend", 'routed_to_backend'),
+        ("Successful Collaborations", 'successful_collaborations'),
+    ),
+    (
+        ("Blocked (Prerequisites)", 'blocked_missing_prerequisites'),
+        ("Blocked (Incomplete UI)", 'blocked_incomplete_ui'),
+        ("Blocked (File Conflicts)", 'blocked_file_conflicts'),
+    ),
+)
+
+
 def _display_metrics(metrics_data):
     """Display metrics in pretty format"""
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+
+    console = _console()
 
     metrics = metrics_data['metrics']
 
@@ -344,23 +510,16 @@ def _display_metrics(metrics_data):
     table.add_column("Metric", style="cyan", no_wrap=True)
     table.add_column("Value", style="green", justify="right")
 
-    table.add_row("Total Requests", str(metrics['total_requests']))
-    table.add_row("Routed to UI", str(metrics['routed_to_ui']))
-    table.add_row("Routed to Backend", str(metrics['routed_to_backend']))
-    table.add_row("Successful Collaborations", str(metrics['successful_collaborations']))
-
-    table.add_section()
-
-    table.add_row("Blocked (Prerequisites)", str(metrics['blocked_missing_prerequisites']))
-    table.add_row("Blocked (Incomplete UI)", str(metrics['blocked_incomplete_ui']))
-    table.add_row("Blocked (File Conflicts)", str(metrics['blocked_file_conflicts']))
-
-    table.add_section()
+    # Numeric cells are passed as Text so rich skips markup parsing
+    for section in _METRIC_SECTIONS:
+        for label, key in section:
+            table.add_row(label, Text(str(metrics[key])))
+        table.add_section()
 
     success_rate = metrics_data['success_rate']
     success_color = "green" if success_rate > 0.9 else "yellow" if success_rate > 0.7 else "red"
     table.add_row("Success Rate", f"[{success_color}]{success_rate:.1%}[/{success_color}]")
-    table.add_row("Total Executions", str(metrics_data['total_executions']))
+    table.add_row("Total Executions", Text(str(metrics_data['total_executions'])))
 
     console.print(table)
 
@@ -368,7 +527,7 @@ def _display_metrics(metrics_data):
     if metrics_data['history']:
         console.print("\n[bold cyan]Recent History:[/bold cyan]")
         for entry in metrics_data['history'][-5:]:
-            status_icon = "✅" if entry['status'] == "completed" else "⚠️" if entry['status'] == "blocked" else "❌"
+            _, status_icon = _STATUS_STYLE.get(entry['status'], _DEFAULT_STATUS_STYLE)
             console.print(f"  {status_icon} {entry['agent']}: {entry['status']} - {entry['timestamp']}")
 
 
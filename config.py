@@ -12,16 +12,49 @@ Usage:
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import functools
 import os
-import json
+import re
 
+import orjson
 
-class Config:
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value"""
+    return value.lower() == "true"
+
+
+# Config values matched through a compiled alternation; the pattern is
+# rebuilt whenever one of them is assigned
+_PATTERN_KEYS = frozenset({
+    "UI_KEYWORDS",
+    "BACKEND_KEYWORDS",
+    "MODIFY_KEYWORDS",
+    "UI_PROTECTED_PATTERNS",
+    "BACKEND_FILE_PATTERNS",
+    "FEATURE_NAME_MAP",
+})
+
+# Compiled alternations shared by configs with the same keywords
+_PATTERN_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _compile_alternation(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into one alternation, longest keyword first"""
+    return re.compile(
+        "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    )
+
+
+class ConfigDefaults:
     """
-    System configuration
+    Default values for the system configuration
     """
 
+    __slots__ = ()
+
     # ==================== ROUTING RULES ====================
 
     # Core enforcement
@@ -185,13 +218,95 @@ class Config:
     LOGIC_AGENT_FILE = CLAUDE_AGENTS_PATH / "feature-logic-implementer.md"
     """Path to feature-logic-implementer agent definition"""
 
+    # Names of all config values (class __dict__ order, no dir() scan)
+    _CONFIG_KEYS = tuple(
+        key for key in vars() if key.isupper() and not key.startswith("_")
+    )
+
+
+class Config(ConfigDefaults):
+    """
+    System configuration
+
+    Each config value is a slot, so instances carry no __dict__ and
+    overrides from file/environment are plain slot writes. The slots
+    shadow the inherited defaults at class level: read defaults from
+    ConfigDefaults (Config.ENFORCE_UI_FIRST is a slot descriptor).
+    """
+
+    __slots__ = ConfigDefaults._CONFIG_KEYS + ("_patterns",)
+
+    # Environment variable -> (config key, parser)
+    _ENV_MAP = {
+        "STRICT_AGENT_ROUTING": ("ENFORCE_UI_FIRST", _parse_bool),
+        "REQUIRE_UI_FIRST": ("REQUIRE_UI_FOUNDATION", _parse_bool),
+        "VERIFY_UI_MANDATORY_FILES": ("VERIFY_COMPLETION", _parse_bool),
+        "PROTECT_UI_FILES": ("PREVENT_FILE_CONFLICTS", _parse_bool),
+        "LOG_LEVEL": ("LOG_LEVEL", str),
+        "API_PORT": ("API_PORT", int),
+    }
+
     # ==================== METHODS ====================
 
+    def __init__(self):
+        # Config key -> compiled alternation (see _PATTERN_KEYS)
+        self._patterns: Dict[str, re.Pattern] = {}
+        for key in self._CONFIG_KEYS:
+            value = getattr(ConfigDefaults, key)
+            # Copy mutable defaults so overrides never leak between instances
+            if isinstance(value, (list, dict)):
+                value = value.copy()
+            setattr(self, key, value)
+
+    def __setattr__(self, key: str, value) -> None:
+        super().__setattr__(key, value)
+        if key in _PATTERN_KEYS:
+            # Lists edited in place must be reassigned to take effect
+            self._patterns[key] = _compile_alternation(tuple(value))
+
+    def match_ui(self, message: str) -> bool:
+        """Check whether message contains any UI keyword"""
+        return self._patterns["UI_KEYWORDS"].search(message) is not None
+
+    def match_backend(self, message: str) -> bool:
+        """Check whether message contains any backend keyword"""
+        return self._patterns["BACKEND_KEYWORDS"].search(message) is not None
+
+    def match_modify(self, message: str) -> bool:
+        """Check whether message contains any modification keyword"""
+        return self._patterns["MODIFY_KEYWORDS"].search(message) is not None
+
+    def is_ui_protected(self, path: str) -> bool:
+        """Check whether path matches a UI_PROTECTED_PATTERNS entry"""
+        normalized = str(path).replace("\\", "/")
+        return self._patterns["UI_PROTECTED_PATTERNS"].search(normalized) is not None
+
+    def is_backend_file(self, path: str) -> bool:
+        """Check whether path matches a BACKEND_FILE_PATTERNS entry"""
+        normalized = str(path).replace("\\", "/")
+        return self._patterns["BACKEND_FILE_PATTERNS"].search(normalized) is not None
+
+    def find_feature(self, message: str) -> Optional[str]:
+        """
+        Find the directory name of the first feature mentioned in message
+
+        Args:
+            message: User's request message
+
+        Returns:
+            Directory name from FEATURE_NAME_MAP, or None if no feature matches
+        """
+        match = self._patterns["FEATURE_NAME_MAP"].search(message)
+        return self.FEATURE_NAME_MAP[match.group(0)] if match else None
+
     @classmethod
     def load(cls, config_file: Optional[Path] = None) -> "Config":
         """
         Load configuration from file
 
+        Every call returns a new instance, so overrides made by one caller
+        never reach another, and reflects the current environment.
+
         Args:
             config_file: Optional JSON config file
 
@@ -201,11 +316,11 @@ class Config:
         config = cls()
 
         if config_file and config_file.exists():
-            data = json.loads(config_file.read_text())
+            data = orjson.loads(config_file.read_bytes())
 
             # Override defaults with file values
             for key, value in data.items():
-                if hasattr(config, key):
+                if key in cls._CONFIG_KEYS:
                     setattr(config, key, value)
 
         # Override with environment variables
@@ -215,27 +330,9 @@ class Config:
 
     def _load_from_env(self):
         """Load configuration from environment variables"""
-
-        # Routing rules
-        if "STRICT_AGENT_ROUTING" in os.environ:
-            self.ENFORCE_UI_FIRST = os.environ["STRICT_AGENT_ROUTING"].lower() == "true"
-
-        if "REQUIRE_UI_FIRST" in os.environ:
-            self.REQUIRE_UI_FOUNDATION = os.environ["REQUIRE_UI_FIRST"].lower() == "true"
-
-        if "VERIFY_UI_MANDATORY_FILES" in os.environ:
-            self.VERIFY_COMPLETION = os.environ["VERIFY_UI_MANDATORY_FILES"].lower() == "true"
-
-        if "PROTECT_UI_FILES" in os.environ:
-            self.PREVENT_FILE_CONFLICTS = os.environ["PROTECT_UI_FILES"].lower() == "true"
-
-        # Logging
-        if "LOG_LEVEL" in os.environ:
-            self.LOG_LEVEL = os.environ["LOG_LEVEL"]
-
-        # API
-        if "API_PORT" in os.environ:
-            self.API_PORT = int(os.environ["API_PORT"])
+        for env_key in os.environ.keys() & self._ENV_MAP.keys():
+            key, parse = self._ENV_MAP[env_key]
+            setattr(self, key, parse(os.environ[env_key]))
 
     def save(self, config_file: Path):
         """
@@ -244,21 +341,13 @@ class Config:
         Args:
             config_file: Path to save config
         """
-        # Get all uppercase attributes (config values)
-        config_data = {
-            key: getattr(self, key)
-            for key in dir(self)
-            if key.isupper() and not key.startswith("_")
-        }
-
-        # Convert Path objects to strings
-        for key, value in config_data.items():
-            if isinstance(value, Path):
-                config_data[key] = str(value)
-            elif isinstance(value, list) and value and isinstance(value[0], Path):
-                config_data[key] = [str(p) for p in value]
-
-        config_file.write_text(json.dumps(config_data, indent=2))
+        # Get all uppercase attributes (config values);
+        # Path objects are written as strings via default=str
+        config_data = self.to_dict()
+
+        config_file.write_bytes(
+            orjson.dumps(config_data, option=orjson.OPT_INDENT_2, default=str)
+        )
 
     def to_dict(self) -> Dict:
         """
@@ -267,11 +356,7 @@ class Config:
         Returns:
             Dictionary with config values
         """
-        return {
-            key: getattr(self, key)
-            for key in dir(self)
-            if key.isupper() and not key.startswith("_")
-        }
+        return {key: getattr(self, key) for key in self._CONFIG_KEYS}
 
     def display(self):
         """Display current configuration"""
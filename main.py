@@ -11,12 +11,19 @@ Usage:
     result = orchestrator.process_request("시간 거래 기능 만들어줘")
 """
 
-import json
+import atexit
 import logging
+import queue
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Union
+from collections import deque
 from enum import Enum
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+
+import orjson
 
 from agent_router import (
     AgentRouter,
@@ -28,18 +35,157 @@ from agent_router import (
 )
 
 
-class AgentStatus(Enum):
-    """Agent execution status"""
+# Supported history export formats; "ndjson" writes one record per line
+HISTORY_FORMATS = ("json", "ndjson")
+
+# Shared by the console and file handlers of every orchestrator
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# Log records buffered before the log file is written
+_LOG_BUFFER_CAPACITY = 200
+
+# Maximum number of results kept for replay of repeated requests
+_REPLAY_CACHE_SIZE = 128
+
+# One queue and listener thread shared by every orchestrator: requests only
+# enqueue records, the listener writes them to the console and to the log
+# file of each live orchestrator. Started by the first orchestrator and
+# stopped at interpreter exit.
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_LOG_LISTENER = QueueListener(_LOG_QUEUE, respect_handler_level=True)
+_LOG_LISTENER_LOCK = threading.Lock()
+
+
+class _StderrHandler(logging.StreamHandler):
+    """StreamHandler that writes to the current sys.stderr, like logging.lastResort"""
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+
+_LOG_CONSOLE_HANDLER = _StderrHandler()
+_LOG_CONSOLE_HANDLER.setFormatter(_LOG_FORMATTER)
+
+
+def _attach_log_handler(handler: logging.Handler) -> None:
+    """Add handler to the shared listener, starting it on first use"""
+    with _LOG_LISTENER_LOCK:
+        if _LOG_LISTENER._thread is None:
+            _LOG_LISTENER.handlers = (_LOG_CONSOLE_HANDLER,)
+            logging.getLogger("AgentOrchestrator").addHandler(QueueHandler(_LOG_QUEUE))
+            _LOG_LISTENER.start()
+            atexit.register(_stop_log_listener)
+        _LOG_LISTENER.handlers += (handler,)
+
+
+def _detach_log_handler(handler: logging.Handler) -> None:
+    """Remove handler from the shared listener once its records are written"""
+    with _LOG_LISTENER_LOCK:
+        if _LOG_LISTENER._thread is None:
+            return
+        # stop() drains the queue, so nothing queued for handler is lost
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER.handlers = tuple(h for h in _LOG_LISTENER.handlers if h is not handler)
+        _LOG_LISTENER.start()
+
+
+def _stop_log_listener() -> None:
+    """Write queued log records and stop the shared listener thread"""
+    with _LOG_LISTENER_LOCK:
+        if _LOG_LISTENER._thread is None:
+            return
+        _LOG_LISTENER.stop()
+        logger = logging.getLogger("AgentOrchestrator")
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler) and handler.queue is _LOG_QUEUE:
+                logger.removeHandler(handler)
+
+# Number of recent results included in get_metrics()
+RECENT_HISTORY_SIZE = 10
+
+# Message templates, filled in with str.format
+_MISSING_UI_FOUNDATION_TMPL = (
+    "❌ Cannot proceed with backend implementation\n\n"
+    "UI foundation not found at: {feature_path}\n\n"
+    "Required files:\n"
+    "- types.ts (TypeScript interfaces)\n"
+    "- api.ts (integration layer)\n"
+    "- components/ (UI components)\n\n"
+    "Next steps:\n"
+    "1. First, run ui-implementer to create the UI structure\n"
+    "2. Then, run feature-logic-implementer to add backend logic\n\n"
+    "Example: 'Create UI for time slots feature first'"
+)
+_UI_PLAN_TMPL = (
+    "✅ Routing to ui-implementer\n\n"
+    "Task: Create UI foundation for feature\n"
+    "Location: {feature_path}\n\n"
+    "Required deliverables:\n"
+    "1. types.ts - TypeScript interfaces\n"
+    "2. api.ts - Integration layer with TODO markers\n"
+    "3. components/ - UI components\n\n"
+    "After completion, feature-logic-implementer can implement backend logic."
+)
+_BACKEND_PLAN_TMPL = (
+    "✅ Routing to feature-logic-implementer\n\n"
+    "Task: Implement backend logic\n"
+    "Location: {feature_path}\n\n"
+    "Found UI foundation:\n"
+    "- types.ts: {types_mark}\n"
+    "- api.ts: {api_mark}\n"
+    "- components/: {components_mark}\n\n"
+    "Tasks:\n"
+    "1. Read api.ts to understand function signatures\n"
+    "2. Implement TODOs in api.ts\n"
+    "3. Create domain/ and services/ layers\n"
+    "4. Setup Supabase integration\n\n"
+    "Restrictions:\n"
+    "- DO NOT modify UI components\n"
+    "- DO NOT change function signatures in api.ts\n"
+    "- DO NOT create new types.ts or api.ts files"
+)
+_COMPLETED_TMPL = (
+    "✅ {agent} completed successfully\n\n"
+    "All required files created at: {feature_path}\n\n"
+)
+_UI_COMPLETED_NEXT_STEP = (
+    "Next step:\n"
+    "Run feature-logic-implementer to implement backend logic."
+)
+
+
+class AgentStatus(str, Enum):
+    """Agent execution status; members are plain strings of their value"""
     IDLE = "idle"
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
     BLOCKED = "blocked"
 
+    __str__ = str.__str__
+
 
 class ExecutionResult:
     """Result of agent execution"""
 
+    __slots__ = (
+        "agent",
+        "status",
+        "message",
+        "files_created",
+        "files_modified",
+        "error",
+        "timestamp_ns",
+        "_timestamp",
+        "_cached_dict",
+    )
+
     def __init__(
         self,
         agent: str,
@@ -55,19 +201,37 @@ class ExecutionResult:
         self.files_created = files_created or []
         self.files_modified = files_modified or []
         self.error = error
-        self.timestamp = datetime.now().isoformat()
+        self.timestamp_ns = time.time_ns()
+        self._timestamp: Optional[str] = None
+        self._cached_dict: Optional[Dict] = None
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 local time of creation, formatted on first access"""
+        if self._timestamp is None:
+            from datetime import datetime
+            self._timestamp = datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
+        return self._timestamp
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return {
-            "agent": self.agent,
-            "status": self.status.value,
-            "message": self.message,
-            "files_created": self.files_created,
-            "files_modified": self.files_modified,
-            "error": self.error,
-            "timestamp": self.timestamp,
-        }
+        """
+        Convert to dictionary
+
+        Results are not changed after construction, so the payload is
+        built once (file lists as tuples) and each call returns a shallow
+        copy that callers may modify without affecting later dumps.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "agent": self.agent,
+                "status": self.status,
+                "message": self.message,
+                "files_created": tuple(self.files_created),
+                "files_modified": tuple(self.files_modified),
+                "error": self.error,
+                "timestamp": self.timestamp,
+            }
+        return dict(self._cached_dict)
 
 
 class AgentOrchestrator:
@@ -86,9 +250,24 @@ class AgentOrchestrator:
         self,
         base_path: str = ".",
         log_level: int = logging.INFO,
+        replay_cache: bool = False,
     ):
+        """
+        Initialize orchestrator
+
+        Args:
+            base_path: Project root containing app/
+            log_level: Level for the console and file log handlers
+            replay_cache: Return the previous result for a repeated request
+                while its feature directory is unchanged
+        """
         self.base_path = Path(base_path)
         self.router = AgentRouter(base_path)
+        # File operation -> router guard
+        self._file_op_checks = {
+            "create": self.router.before_create_file,
+            "modify": self.router.before_modify_file,
+        }
         self.metrics = RoutingMetrics()
 
         # Setup logging
@@ -96,37 +275,67 @@ class AgentOrchestrator:
 
         # Execution history
         self.history: List[ExecutionResult] = []
+        self._recent: "deque[ExecutionResult]" = deque(maxlen=RECENT_HISTORY_SIZE)
 
         # Current state
         self.current_agent: Optional[str] = None
         self.current_feature_path: Optional[Path] = None
 
+        # Guards history, _recent, current_* and the replay cache, which
+        # concurrent requests (API worker threads) all write to. Router
+        # checks are read-only and RoutingMetrics has its own lock.
+        self._state_lock = threading.Lock()
+
+        # (message, context) -> (result, feature_path, existing-files flags,
+        # router flags)
+        self.replay_cache_enabled = replay_cache
+        self._replay_cache: Dict[tuple, tuple] = {}
+
     def _setup_logging(self, log_level: int) -> logging.Logger:
         """Setup logging configuration"""
         logger = logging.getLogger("AgentOrchestrator")
         logger.setLevel(log_level)
 
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(formatter)
-
-        logger.addHandler(console_handler)
+        # Console handler (shared, so each record is printed once)
+        _LOG_CONSOLE_HANDLER.setLevel(log_level)
 
         # File handler
         log_file = self.base_path / "agent_orchestrator.log"
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_LOG_FORMATTER)
+
+        # Batch file writes; warnings and errors still go out immediately
+        buffered_file_handler = MemoryHandler(
+            _LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+        )
+        buffered_file_handler.setLevel(log_level)
+
+        self._log_handler: Optional[MemoryHandler] = buffered_file_handler
+        self._log_file_handler = file_handler
+        _attach_log_handler(buffered_file_handler)
+        atexit.register(self.shutdown)
 
         return logger
 
+    def shutdown(self) -> None:
+        """Write this orchestrator's queued log records and close its log file"""
+        if self._log_handler is None:
+            return
+        _detach_log_handler(self._log_handler)
+        # Closing the buffer flushes it into the file handler
+        self._log_handler.close()
+        self._log_file_handler.close()
+        self._log_handler = None
+        atexit.unregister(self.shutdown)
+
+    def _record(self, result: ExecutionResult) -> ExecutionResult:
+        """Append result to the history and the recent-results preview"""
+        with self._state_lock:
+            self.history.append(result)
+            self._recent.append(result)
+        return result
+
     def process_request(
         self,
         user_message: str,
@@ -142,12 +351,92 @@ class AgentOrchestrator:
         Returns:
             ExecutionResult with outcome
         """
-        self.logger.info(f"Processing request: {user_message}")
+        key = self._replay_key(user_message, context)
+        if key is not None:
+            cached = self._replay_cache.get(key)
+            if cached is not None:
+                result, feature_path, files, flags = cached
+                # Routing depends only on the message, the feature's files
+                # and the router's enforcement flags
+                if (
+                    self._router_flags() == flags
+                    and self.router.check_existing_files(feature_path) == files
+                ):
+                    self.logger.info("Replaying result for: %s", user_message)
+                    # Count the replay exactly as the pipeline would have
+                    if result.status is AgentStatus.BLOCKED:
+                        # The only block process_request produces
+                        self.metrics.record_block("missing_prerequisites")
+                    else:
+                        self.metrics.record_route(result.agent)
+                    # Fresh result so history entries stay distinct and
+                    # carry their own timestamp
+                    return self._record(
+                        ExecutionResult(
+                            result.agent,
+                            result.status,
+                            result.message,
+                            list(result.files_created),
+                            list(result.files_modified),
+                            result.error,
+                        )
+                    )
+
+        result = self._record(self._process_request(user_message, context))
+
+        if key is not None and result.status is not AgentStatus.FAILED:
+            feature_path = self.router.extract_feature_path(user_message, context or {})
+            entry = (
+                result,
+                feature_path,
+                self.router.check_existing_files(feature_path),
+                self._router_flags(),
+            )
+            with self._state_lock:
+                if len(self._replay_cache) >= _REPLAY_CACHE_SIZE:
+                    # Evict oldest entry (dicts preserve insertion order)
+                    del self._replay_cache[next(iter(self._replay_cache))]
+                self._replay_cache[key] = entry
+
+        return result
+
+    def _replay_key(self, user_message: str, context: Optional[Dict]) -> Optional[tuple]:
+        """Replay cache key, or None when caching is off or context is unhashable"""
+        if not self.replay_cache_enabled:
+            return None
+        try:
+            return (user_message, frozenset((context or {}).items()))
+        except TypeError:
+            return None
+
+    def _router_flags(self) -> tuple:
+        """Router enforcement flags a replayed result depends on"""
+        router = self.router
+        return (
+            router.enforce_ui_first,
+            router.verify_prerequisites_enabled,
+            router.verify_completion_enabled,
+            router.prevent_file_conflicts,
+            router.allow_manual_override,
+        )
+
+    def clear_replay_cache(self) -> None:
+        """Forget all results kept for replay"""
+        with self._state_lock:
+            self._replay_cache.clear()
+
+    def _process_request(
+        self,
+        user_message: str,
+        context: Optional[Dict],
+    ) -> ExecutionResult:
+        """Run the routing pipeline for process_request"""
+        self.logger.info("Processing request: %s", user_message)
 
         try:
             # Step 1: Route the request
             agent = self.router.route_request(user_message, context)
-            self.logger.info(f"Routing decision: {agent}")
+            self.logger.info("Routing decision: %s", agent)
 
             # Step 2: Handle routing result
             if agent.startswith("error:"):
@@ -155,13 +444,20 @@ class AgentOrchestrator:
 
             # Step 3: Extract feature path
             feature_path = self.router.extract_feature_path(user_message, context or {})
-            self.current_feature_path = feature_path
-            self.logger.info(f"Feature path: {feature_path}")
 
-            # Step 4: Verify prerequisites
-            can_run, error_msg = self.router.verify_prerequisites(agent, feature_path)
+            with self._state_lock:
+                self.current_feature_path = feature_path
+            self.logger.info("Feature path: %s", feature_path)
+
+            # Step 4: Verify prerequisites (one file check shared with the plan)
+            files_exist = None
+            if agent == "feature-logic-implementer":
+                files_exist = self.router.check_existing_files(feature_path)
+            can_run, error_msg = self.router.verify_prerequisites(
+                agent, feature_path, files_exist
+            )
             if not can_run:
-                self.logger.warning(f"Prerequisites check failed: {error_msg}")
+                self.logger.warning("Prerequisites check failed: %s", error_msg)
                 self.metrics.record_block("missing_prerequisites")
 
                 return ExecutionResult(
@@ -175,10 +471,12 @@ class AgentOrchestrator:
             self.metrics.record_route(agent)
 
             # Step 6: Return execution plan
-            return self._create_execution_plan(agent, user_message, feature_path)
+            return self._create_execution_plan(
+                agent, user_message, feature_path, files_exist
+            )
 
         except Exception as e:
-            self.logger.error(f"Error processing request: {e}", exc_info=True)
+            self.logger.error("Error processing request: %s", e, exc_info=True)
             return ExecutionResult(
                 agent="error",
                 status=AgentStatus.FAILED,
@@ -186,6 +484,27 @@ class AgentOrchestrator:
                 error=type(e).__name__,
             )
 
+    async def process_request_async(
+        self,
+        user_message: str,
+        context: Optional[Dict] = None,
+    ) -> ExecutionResult:
+        """
+        Async variant of process_request for event-loop callers
+
+        The pipeline runs as a whole on a worker thread: its steps depend
+        on each other and are far cheaper than a thread hop each.
+
+        Args:
+            user_message: User's request message
+            context: Additional context (current_path, etc.)
+
+        Returns:
+            ExecutionResult with outcome
+        """
+        import asyncio  # Only event-loop callers pay for the import
+        return await asyncio.to_thread(self.process_request, user_message, context)
+
     def _handle_routing_error(
         self,
         error_code: str,
@@ -203,30 +522,9 @@ class AgentOrchestrator:
         Returns:
             ExecutionResult with error details
         """
-        if error_code == "error:missing_ui_foundation":
-            feature_path = self.router.extract_feature_path(user_message, context or {})
-
-            error_msg = (
-                f"❌ Cannot proceed with backend implementation\n\n"
-                f"UI foundation not found at: {feature_path}\n\n"
-                f"Required files:\n"
-                f"- types.ts (TypeScript interfaces)\n"
-                f"- api.ts (integration layer)\n"
-                f"- components/ (UI components)\n\n"
-                f"Next steps:\n"
-                f"1. First, run ui-implementer to create the UI structure\n"
-                f"2. Then, run feature-logic-implementer to add backend logic\n\n"
-                f"Example: 'Create UI for time slots feature first'"
-            )
-
-            self.metrics.record_block("missing_prerequisites")
-
-            return ExecutionResult(
-                agent="feature-logic-implementer",
-                status=AgentStatus.BLOCKED,
-                message=error_msg,
-                error="MissingUIFoundation",
-            )
+        handler = self._ROUTING_ERROR_HANDLERS.get(error_code)
+        if handler is not None:
+            return handler(self, user_message, context)
 
         return ExecutionResult(
             agent="error",
@@ -235,11 +533,36 @@ class AgentOrchestrator:
             error="UnknownRoutingError",
         )
 
+    def _missing_ui_foundation(
+        self,
+        user_message: str,
+        context: Optional[Dict],
+    ) -> ExecutionResult:
+        """Block backend work that has no UI foundation to build on"""
+        feature_path = self.router.extract_feature_path(user_message, context or {})
+
+        error_msg = _MISSING_UI_FOUNDATION_TMPL.format(feature_path=feature_path)
+
+        self.metrics.record_block("missing_prerequisites")
+
+        return ExecutionResult(
+            agent="feature-logic-implementer",
+            status=AgentStatus.BLOCKED,
+            message=error_msg,
+            error="MissingUIFoundation",
+        )
+
+    # Router error code -> handler
+    _ROUTING_ERROR_HANDLERS = {
+        "error:missing_ui_foundation": _missing_ui_foundation,
+    }
+
     def _create_execution_plan(
         self,
         agent: str,
         user_message: str,
         feature_path: Path,
+        files_exist: Optional[Dict[str, bool]] = None,
     ) -> ExecutionResult:
         """
         Create execution plan for agent
@@ -248,55 +571,14 @@ class AgentOrchestrator:
             agent: Agent to execute
             user_message: User's request
             feature_path: Feature directory path
+            files_exist: check_existing_files() result, looked up if omitted
 
         Returns:
             ExecutionResult with execution plan
         """
-        if agent == "ui-implementer":
-            message = (
-                f"✅ Routing to ui-implementer\n\n"
-                f"Task: Create UI foundation for feature\n"
-                f"Location: {feature_path}\n\n"
-                f"Required deliverables:\n"
-                f"1. types.ts - TypeScript interfaces\n"
-                f"2. api.ts - Integration layer with TODO markers\n"
-                f"3. components/ - UI components\n\n"
-                f"After completion, feature-logic-implementer can implement backend logic."
-            )
-
-            return ExecutionResult(
-                agent=agent,
-                status=AgentStatus.RUNNING,
-                message=message,
-            )
-
-        elif agent == "feature-logic-implementer":
-            files_exist = self.router.check_existing_files(feature_path)
-
-            message = (
-                f"✅ Routing to feature-logic-implementer\n\n"
-                f"Task: Implement backend logic\n"
-                f"Location: {feature_path}\n\n"
-                f"Found UI foundation:\n"
-                f"- types.ts: {'✓' if files_exist['types_exists'] else '✗'}\n"
-                f"- api.ts: {'✓' if files_exist['api_exists'] else '✗'}\n"
-                f"- components/: {'✓' if files_exist['components_exist'] else '✗'}\n\n"
-                f"Tasks:\n"
-                f"1. Read api.ts to understand function signatures\n"
-                f"2. Implement TODOs in api.ts\n"
-                f"3. Create domain/ and services/ layers\n"
-                f"4. Setup Supabase integration\n\n"
-                f"Restrictions:\n"
-                f"- DO NOT modify UI components\n"
-                f"- DO NOT change function signatures in api.ts\n"
-                f"- DO NOT create new types.ts or api.ts files"
-            )
-
-            return ExecutionResult(
-                agent=agent,
-                status=AgentStatus.RUNNING,
-                message=message,
-            )
+        builder = self._PLAN_BUILDERS.get(agent)
+        if builder is not None:
+            return builder(self, feature_path, files_exist)
 
         return ExecutionResult(
             agent=agent,
@@ -305,10 +587,50 @@ class AgentOrchestrator:
             error="UnknownAgent",
         )
 
+    def _ui_plan(
+        self,
+        feature_path: Path,
+        files_exist: Optional[Dict[str, bool]],
+    ) -> ExecutionResult:
+        """Execution plan for ui-implementer"""
+        return ExecutionResult(
+            agent="ui-implementer",
+            status=AgentStatus.RUNNING,
+            message=_UI_PLAN_TMPL.format(feature_path=feature_path),
+        )
+
+    def _backend_plan(
+        self,
+        feature_path: Path,
+        files_exist: Optional[Dict[str, bool]],
+    ) -> ExecutionResult:
+        """Execution plan for feature-logic-implementer"""
+        if files_exist is None:
+            files_exist = self.router.check_existing_files(feature_path)
+
+        message = _BACKEND_PLAN_TMPL.format(
+            feature_path=feature_path,
+            types_mark="✓" if files_exist["types_exists"] else "✗",
+            api_mark="✓" if files_exist["api_exists"] else "✗",
+            components_mark="✓" if files_exist["components_exist"] else "✗",
+        )
+
+        return ExecutionResult(
+            agent="feature-logic-implementer",
+            status=AgentStatus.RUNNING,
+            message=message,
+        )
+
+    # Agent name -> execution plan builder
+    _PLAN_BUILDERS = {
+        "ui-implementer": _ui_plan,
+        "feature-logic-implementer": _backend_plan,
+    }
+
     def verify_agent_completion(
         self,
         agent: str,
-        feature_path: Path,
+        feature_path: Union[str, Path],
     ) -> ExecutionResult:
         """
         Verify agent completed all required tasks
@@ -320,13 +642,18 @@ class AgentOrchestrator:
         Returns:
             ExecutionResult with verification result
         """
-        self.logger.info(f"Verifying completion for {agent} at {feature_path}")
+        feature_path = Path(feature_path)
+        return self._record(self._verify_agent_completion(agent, feature_path))
+
+    def _verify_agent_completion(self, agent: str, feature_path: Path) -> ExecutionResult:
+        """Run the completion checks for verify_agent_completion"""
+        self.logger.info("Verifying completion for %s at %s", agent, feature_path)
 
         try:
             is_complete, error_msg = self.router.verify_completion(agent, feature_path)
 
             if not is_complete:
-                self.logger.warning(f"Completion check failed: {error_msg}")
+                self.logger.warning("Completion check failed: %s", error_msg)
                 self.metrics.record_block("incomplete_ui")
 
                 return ExecutionResult(
@@ -339,16 +666,10 @@ class AgentOrchestrator:
             # Success
             self.metrics.record_success()
 
-            message = (
-                f"✅ {agent} completed successfully\n\n"
-                f"All required files created at: {feature_path}\n\n"
-            )
+            message = _COMPLETED_TMPL.format(agent=agent, feature_path=feature_path)
 
             if agent == "ui-implementer":
-                message += (
-                    f"Next step:\n"
-                    f"Run feature-logic-implementer to implement backend logic."
-                )
+                message += _UI_COMPLETED_NEXT_STEP
 
             return ExecutionResult(
                 agent=agent,
@@ -357,7 +678,7 @@ class AgentOrchestrator:
             )
 
         except Exception as e:
-            self.logger.error(f"Error verifying completion: {e}", exc_info=True)
+            self.logger.error("Error verifying completion: %s", e, exc_info=True)
             return ExecutionResult(
                 agent=agent,
                 status=AgentStatus.FAILED,
@@ -369,7 +690,7 @@ class AgentOrchestrator:
         self,
         agent: str,
         operation: str,
-        file_path: Path,
+        file_path: Union[str, Path],
     ) -> Optional[str]:
         """
         Check if file operation is allowed
@@ -382,58 +703,96 @@ class AgentOrchestrator:
         Returns:
             Error message if forbidden, None if allowed
         """
-        try:
-            if operation == "create":
-                self.router.before_create_file(agent, file_path)
-            elif operation == "modify":
-                self.router.before_modify_file(agent, file_path)
+        check = self._file_op_checks.get(operation)
+        if check is None:
+            return None
 
+        try:
+            check(agent, Path(file_path))
             return None
 
         except ForbiddenOperationError as e:
-            self.logger.warning(f"Forbidden operation: {e}")
+            self.logger.warning("Forbidden operation: %s", e)
             self.metrics.record_block("file_conflicts")
             return str(e)
 
-    def get_metrics(self) -> Dict[str, Any]:
+    def get_metrics(self, include_history: bool = True) -> Dict[str, Any]:
         """
         Get current metrics
 
+        Args:
+            include_history: Include the last 10 results as a preview
+
         Returns:
             Dictionary with metrics and statistics
         """
-        metrics = self.metrics.get_metrics()
+        metrics, success_rate = self.metrics.snapshot()
+
+        with self._state_lock:
+            data = {
+                "metrics": metrics,
+                "success_rate": success_rate,
+                "total_executions": len(self.history),
+            }
+            recent = list(self._recent) if include_history else None
+        if recent is not None:
+            # Converted here so recording never formats timestamps
+            data["history"] = [r.to_dict() for r in recent]
+        return data
+
+    def get_history_data(self) -> Dict[str, Any]:
+        """
+        Get execution history with current metrics
+
+        Returns:
+            Dictionary with timestamp, metrics and full history
+        """
+        from datetime import datetime
+
+        with self._state_lock:
+            history = list(self.history)
 
         return {
-            "metrics": metrics,
-            "success_rate": self.metrics.get_success_rate(),
-            "total_executions": len(self.history),
-            "history": [r.to_dict() for r in self.history[-10:]],  # Last 10
+            "timestamp": datetime.now().isoformat(),
+            # The full history follows, so skip the metrics preview of it
+            "metrics": self.get_metrics(include_history=False),
+            "history": [r.to_dict() for r in history],
         }
 
-    def export_history(self, output_file: Optional[Path] = None) -> str:
+    def export_history(
+        self,
+        output_file: Optional[Path] = None,
+        fmt: Optional[str] = None,
+    ) -> str:
         """
-        Export execution history to JSON
+        Export execution history to JSON or NDJSON
 
         Args:
             output_file: Optional output file path
+            fmt: "json" or "ndjson"; defaults to "ndjson" for .ndjson
+                files and "json" otherwise
 
         Returns:
-            JSON string of history
+            Exported history as a string, also when written to output_file
         """
-        history_data = {
-            "timestamp": datetime.now().isoformat(),
-            "metrics": self.get_metrics(),
-            "history": [r.to_dict() for r in self.history],
-        }
-
-        json_str = json.dumps(history_data, indent=2)
+        if fmt is None:
+            fmt = "ndjson" if output_file and output_file.suffix == ".ndjson" else "json"
+        if fmt not in HISTORY_FORMATS:
+            raise ValueError(f"Unknown history format: {fmt}")
+
+        if fmt == "ndjson":
+            # One record per line, encoded independently of the rest
+            with self._state_lock:
+                history = list(self.history)
+            data = b"".join(orjson.dumps(r.to_dict()) + b"\n" for r in history)
+        else:
+            data = orjson.dumps(self.get_history_data(), option=orjson.OPT_INDENT_2)
 
         if output_file:
-            output_file.write_text(json_str)
-            self.logger.info(f"History exported to {output_file}")
+            output_file.write_bytes(data)
+            self.logger.info("History exported to %s", output_file)
 
-        return json_str
+        return data.decode("utf-8")
 
 
 def main():
@@ -14,12 +14,117 @@ Usage:
     collector.display_dashboard()
 """
 
+import math
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 import json
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+from itertools import islice
+
+
+# Errors kept per error type
+ERRORS_PER_TYPE = 100
+
+# Fixed totals in MetricsCollector.counters, pre-seeded at zero
+COUNTER_NAMES = (
+    "total_routing_decisions",
+    "total_prerequisite_checks",
+    "prerequisite_checks_passed",
+    "prerequisite_checks_failed",
+    "total_completion_verifications",
+    "completion_verifications_passed",
+    "completion_verifications_failed",
+    "total_file_operations",
+    "file_operations_allowed",
+    "file_operations_blocked",
+    "conflict_preventions",
+    "total_errors",
+)
+
+# Events included in get_summary()['recent_events']
+RECENT_EVENTS = 10
+
+# Kinds of per-name counters (MetricsCollector.counters_by_kind)
+COUNTER_KINDS = ("routed_to", "request_type", "blocked", "successful", "error")
+
+# MetricsCollector timestamp_mode values
+TIMESTAMP_MODES = ("exact", "none")
+
+# Event timestamps are stored as raw time.time() floats and only
+# formatted when events are read back out
+_now = time.time
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    """Format an event timestamp as ISO-8601 local time"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _with_iso_timestamp(event: NamedTuple) -> Dict:
+    """Event as a dictionary, with its timestamp formatted"""
+    data = event._asdict()
+    data['timestamp'] = _iso(event.timestamp)
+    return data
+
+
+class RoutingEvent(NamedTuple):
+    """Routing decision in the event history"""
+    timestamp: Optional[float]
+    event_type: str
+    agent: str
+    request_type: str
+    duration_ms: Optional[float]
+
+
+class PrerequisiteEvent(NamedTuple):
+    """Prerequisite check in the event history"""
+    timestamp: Optional[float]
+    event_type: str
+    agent: str
+    passed: bool
+    missing_files: List[str]
+
+
+class CompletionEvent(NamedTuple):
+    """Completion verification in the event history"""
+    timestamp: Optional[float]
+    event_type: str
+    agent: str
+    passed: bool
+    missing_deliverables: List[str]
+
+
+class FileOperationEvent(NamedTuple):
+    """File operation check in the event history"""
+    timestamp: Optional[float]
+    event_type: str
+    agent: str
+    operation: str
+    file_path: str
+    allowed: bool
+    error: Optional[str]
+
+
+class ErrorEvent(NamedTuple):
+    """Error in the event history"""
+    timestamp: Optional[float]
+    event_type: str
+    error_type: str
+    error_message: str
+
+
+class ErrorRecord(NamedTuple):
+    """Entry in MetricsCollector.errors"""
+    timestamp: Optional[float]
+    error_type: str
+    error_message: str
+    context: Dict
 
 
 class MetricsCollector:
@@ -27,29 +132,67 @@ class MetricsCollector:
     Collects and stores metrics for monitoring
     """
 
-    def __init__(self, history_size: int = 1000):
+    def __init__(self, history_size: int = 1000, timestamp_mode: str = "exact"):
         """
         Initialize metrics collector
 
         Args:
             history_size: Maximum number of events to keep in history
+            timestamp_mode: "exact" reads the clock per event, "none"
+                stores no event timestamps
+
+        Raises:
+            ValueError: If timestamp_mode is unknown
         """
+        if timestamp_mode not in TIMESTAMP_MODES:
+            raise ValueError(f"Unknown timestamp mode: {timestamp_mode}")
+        self.timestamp_mode = timestamp_mode
+        if timestamp_mode == "none":
+            self._timestamp = lambda: None
+        else:
+            self._timestamp = _now
+
         # Counters
-        self.counters = defaultdict(int)
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTER_NAMES, 0)
 
-        # Timing data
-        self.timings = defaultdict(list)
+        # Per-name counters by kind, kept apart from the totals so readers
+        # iterate only the group they need; get_summary() flattens them
+        # into counters as "<kind>_<name>"
+        self.counters_by_kind: Dict[str, Counter] = {
+            kind: Counter() for kind in COUNTER_KINDS
+        }
+        # Direct references for the record_* hot paths
+        self.routed_counters = self.counters_by_kind['routed_to']
+        self.request_type_counters = self.counters_by_kind['request_type']
+        self.blocked_counters = self.counters_by_kind['blocked']
+        self.successful_counters = self.counters_by_kind['successful']
+        self.error_counters = self.counters_by_kind['error']
+
+        # Timing aggregates per key, updated as samples arrive
+        self.timings: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {'count': 0, 'sum': 0.0, 'min': math.inf, 'max': -math.inf}
+        )
 
         # Event history (circular buffer)
         self.history_size = history_size
         self.event_history: deque = deque(maxlen=history_size)
 
-        # Error tracking
-        self.errors = defaultdict(list)
+        # Error tracking (last ERRORS_PER_TYPE per error type)
+        self.errors: Dict[str, deque] = defaultdict(lambda: deque(maxlen=ERRORS_PER_TYPE))
+
+        # Running totals behind get_success_rate() and the alert rates
+        self._blocked_total = 0
+        self._error_total = 0
 
         # Start time
         self.start_time = datetime.now()
 
+        # Bumped by every record_* call; get_summary() reuses its last
+        # result while the version is unchanged
+        self._version = 0
+        self._summary_cache: Optional[Dict] = None
+        self._summary_version = -1
+
     def record_routing_decision(
         self,
         agent: str,
@@ -65,19 +208,59 @@ class MetricsCollector:
             duration_ms: Time taken for decision (ms)
         """
         self.counters['total_routing_decisions'] += 1
-        self.counters[f'routed_to_{agent}'] += 1
-        self.counters[f'request_type_{request_type}'] += 1
+        self.routed_counters[agent] += 1
+        self.request_type_counters[request_type] += 1
 
         if duration_ms is not None:
-            self.timings['routing_decision'].append(duration_ms)
+            self._record_timing('routing_decision', duration_ms)
 
-        self.event_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'event_type': 'routing_decision',
-            'agent': agent,
-            'request_type': request_type,
-            'duration_ms': duration_ms,
-        })
+        self.event_history.append(RoutingEvent(
+            self._timestamp(), 'routing_decision', agent, request_type, duration_ms,
+        ))
+
+        self._version += 1
+
+    def record_routing_decisions(
+        self,
+        decisions: Iterable[Tuple[str, str, Optional[float]]],
+    ):
+        """
+        Record many routing decisions at once (replay / backfill)
+
+        Counters are updated once per batch instead of once per decision.
+
+        Args:
+            decisions: (agent, request_type, duration_ms) tuples
+        """
+        decisions = list(decisions)
+        if not decisions:
+            return
+
+        self.counters['total_routing_decisions'] += len(decisions)
+        self.routed_counters.update(agent for agent, _, _ in decisions)
+        self.request_type_counters.update(request_type for _, request_type, _ in decisions)
+
+        for _, _, duration_ms in decisions:
+            if duration_ms is not None:
+                self._record_timing('routing_decision', duration_ms)
+
+        timestamp = self._timestamp()
+        self.event_history.extend(
+            RoutingEvent(timestamp, 'routing_decision', agent, request_type, duration_ms)
+            for agent, request_type, duration_ms in decisions
+        )
+
+        self._version += 1
+
+    def _record_timing(self, key: str, duration_ms: float):
+        """Fold one timing sample into the aggregates for key"""
+        timing = self.timings[key]
+        timing['count'] += 1
+        timing['sum'] += duration_ms
+        if duration_ms < timing['min']:
+            timing['min'] = duration_ms
+        if duration_ms > timing['max']:
+            timing['max'] = duration_ms
 
     def record_prerequisite_check(
         self,
@@ -99,15 +282,14 @@ class MetricsCollector:
             self.counters['prerequisite_checks_passed'] += 1
         else:
             self.counters['prerequisite_checks_failed'] += 1
-            self.counters[f'blocked_{agent}'] += 1
+            self._blocked_total += 1
+            self.blocked_counters[agent] += 1
 
-        self.event_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'event_type': 'prerequisite_check',
-            'agent': agent,
-            'passed': passed,
-            'missing_files': missing_files or [],
-        })
+        self.event_history.append(PrerequisiteEvent(
+            self._timestamp(), 'prerequisite_check', agent, passed, missing_files or [],
+        ))
+
+        self._version += 1
 
     def record_completion_verification(
         self,
@@ -127,17 +309,16 @@ class MetricsCollector:
 
         if passed:
             self.counters['completion_verifications_passed'] += 1
-            self.counters[f'successful_{agent}'] += 1
+            self.successful_counters[agent] += 1
         else:
             self.counters['completion_verifications_failed'] += 1
+            self._blocked_total += 1
 
-        self.event_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'event_type': 'completion_verification',
-            'agent': agent,
-            'passed': passed,
-            'missing_deliverables': missing_deliverables or [],
-        })
+        self.event_history.append(CompletionEvent(
+            self._timestamp(), 'completion_verification', agent, passed, missing_deliverables or [],
+        ))
+
+        self._version += 1
 
     def record_file_operation(
         self,
@@ -163,17 +344,14 @@ class MetricsCollector:
             self.counters['file_operations_allowed'] += 1
         else:
             self.counters['file_operations_blocked'] += 1
+            self._blocked_total += 1
             self.counters['conflict_preventions'] += 1
 
-        self.event_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'event_type': 'file_operation',
-            'agent': agent,
-            'operation': operation,
-            'file_path': file_path,
-            'allowed': allowed,
-            'error': error,
-        })
+        self.event_history.append(FileOperationEvent(
+            self._timestamp(), 'file_operation', agent, operation, file_path, allowed, error,
+        ))
+
+        self._version += 1
 
     def record_error(
         self,
@@ -190,23 +368,19 @@ class MetricsCollector:
             context: Additional context
         """
         self.counters['total_errors'] += 1
-        self.counters[f'error_{error_type}'] += 1
+        self._error_total += 1
+        self.error_counters[error_type] += 1
 
-        error_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'error_type': error_type,
-            'error_message': error_message,
-            'context': context or {},
-        }
+        timestamp = self._timestamp()
+        self.errors[error_type].append(
+            ErrorRecord(timestamp, error_type, error_message, context or {})
+        )
 
-        self.errors[error_type].append(error_entry)
+        self.event_history.append(
+            ErrorEvent(timestamp, 'error', error_type, error_message)
+        )
 
-        self.event_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'event_type': 'error',
-            'error_type': error_type,
-            'error_message': error_message,
-        })
+        self._version += 1
 
     def get_summary(self) -> Dict:
         """
@@ -217,19 +391,36 @@ class MetricsCollector:
         """
         uptime = datetime.now() - self.start_time
 
+        if self._summary_version != self._version:
+            self._summary_cache = self._build_summary()
+            self._summary_version = self._version
+
+        return {'uptime_seconds': uptime.total_seconds(), **self._summary_cache}
+
+    def _build_summary(self) -> Dict:
+        """Summary fields that only change when an event is recorded"""
+        counters = dict(self.counters)
+        for kind, group in self.counters_by_kind.items():
+            for name, value in group.items():
+                counters[f'{kind}_{name}'] = value
+
         return {
-            'uptime_seconds': uptime.total_seconds(),
-            'counters': dict(self.counters),
+            # Read-only: the same mapping is handed out until the next event
+            'counters': MappingProxyType(counters),
             'timings': {
                 key: {
-                    'count': len(values),
-                    'avg_ms': sum(values) / len(values) if values else 0,
-                    'min_ms': min(values) if values else 0,
-                    'max_ms': max(values) if values else 0,
+                    'count': t['count'],
+                    'avg_ms': t['sum'] / t['count'] if t['count'] else 0,
+                    'min_ms': t['min'] if t['count'] else 0,
+                    'max_ms': t['max'] if t['count'] else 0,
                 }
-                for key, values in self.timings.items()
+                for key, t in self.timings.items()
             },
-            'recent_events': list(self.event_history)[-10:],
+            # Walk back from the newest event instead of copying the history
+            'recent_events': [
+                _with_iso_timestamp(e)
+                for e in reversed(list(islice(reversed(self.event_history), RECENT_EVENTS)))
+            ],
         }
 
     def get_success_rate(self) -> float:
@@ -243,13 +434,17 @@ class MetricsCollector:
         if total == 0:
             return 1.0
 
-        blocked = (
-            self.counters['prerequisite_checks_failed'] +
-            self.counters['completion_verifications_failed'] +
-            self.counters['file_operations_blocked']
-        )
+        return 1.0 - (self._blocked_total / total)
 
-        return 1.0 - (blocked / total)
+    def totals(self) -> Tuple[int, int, int]:
+        """
+        Running totals behind the alert rates
+
+        Returns:
+            (version, error total, blocked total); version changes with
+            every recorded event
+        """
+        return self._version, self._error_total, self._blocked_total
 
     def export_metrics(self, output_file: Path):
         """
@@ -258,14 +453,20 @@ class MetricsCollector:
         Args:
             output_file: Path to output file
         """
+        summary = self.get_summary()
         data = {
             'timestamp': datetime.now().isoformat(),
-            'summary': self.get_summary(),
-            'errors': {k: v[-100:] for k, v in self.errors.items()},  # Last 100 errors
-            'history': list(self.event_history),
+            'summary': {**summary, 'counters': dict(summary['counters'])},
+            'errors': {
+                k: [_with_iso_timestamp(e) for e in v]
+                for k, v in self.errors.items()
+            },
+            'history': [_with_iso_timestamp(e) for e in self.event_history],
         }
 
-        output_file.write_text(json.dumps(data, indent=2))
+        # json.dump writes chunks as it encodes instead of building one string
+        with output_file.open('w', encoding='utf-8') as fp:
+            json.dump(data, fp, indent=2)
 
 
 class Dashboard:
@@ -288,77 +489,79 @@ class Dashboard:
         """
         summary = self.collector.get_summary()
 
-        print("\n" + "=" * 80)
-        print("AGENT ORCHESTRATION SYSTEM - MONITORING DASHBOARD")
-        print("=" * 80)
+        # Collected and written at once rather than one print() per line
+        lines = []
+        lines.append("\n" + "=" * 80)
+        lines.append("AGENT ORCHESTRATION SYSTEM - MONITORING DASHBOARD")
+        lines.append("=" * 80)
 
         # Uptime
         uptime = timedelta(seconds=int(summary['uptime_seconds']))
-        print(f"\n📊 Uptime: {uptime}")
+        lines.append(f"\n📊 Uptime: {uptime}")
 
         # Main metrics
         counters = summary['counters']
-        print("\n🎯 ROUTING DECISIONS:")
-        print(f"  Total: {counters.get('total_routing_decisions', 0)}")
-        print(f"  → ui-implementer: {counters.get('routed_to_ui-implementer', 0)}")
-        print(f"  → feature-logic-implementer: {counters.get('routed_to_feature-logic-implementer', 0)}")
+        lines.append("\n🎯 ROUTING DECISIONS:")
+        lines.append(f"  Total: {counters.get('total_routing_decisions', 0)}")
+        routed = self.collector.routed_counters
+        lines.append(f"  → ui-implementer: {routed.get('ui-implementer', 0)}")
+        lines.append(f"  → feature-logic-implementer: {routed.get('feature-logic-implementer', 0)}")
 
         # Request types
-        print("\n📝 REQUEST TYPES:")
-        for key, value in counters.items():
-            if key.startswith('request_type_'):
-                req_type = key.replace('request_type_', '')
-                print(f"  {req_type}: {value}")
+        lines.append("\n📝 REQUEST TYPES:")
+        for req_type, value in self.collector.request_type_counters.items():
+            lines.append(f"  {req_type}: {value}")
 
         # Prerequisite checks
-        print("\n✅ PREREQUISITE CHECKS:")
+        lines.append("\n✅ PREREQUISITE CHECKS:")
         total_checks = counters.get('total_prerequisite_checks', 0)
         passed_checks = counters.get('prerequisite_checks_passed', 0)
         failed_checks = counters.get('prerequisite_checks_failed', 0)
-        print(f"  Total: {total_checks}")
-        print(f"  Passed: {passed_checks}")
-        print(f"  Failed: {failed_checks}")
+        lines.append(f"  Total: {total_checks}")
+        lines.append(f"  Passed: {passed_checks}")
+        lines.append(f"  Failed: {failed_checks}")
 
         # Completion verifications
-        print("\n🎉 COMPLETION VERIFICATIONS:")
+        lines.append("\n🎉 COMPLETION VERIFICATIONS:")
         total_verifications = counters.get('total_completion_verifications', 0)
         passed_verifications = counters.get('completion_verifications_passed', 0)
         failed_verifications = counters.get('completion_verifications_failed', 0)
-        print(f"  Total: {total_verifications}")
-        print(f"  Passed: {passed_verifications}")
-        print(f"  Failed: {failed_verifications}")
+        lines.append(f"  Total: {total_verifications}")
+        lines.append(f"  Passed: {passed_verifications}")
+        lines.append(f"  Failed: {failed_verifications}")
 
         # File operations
-        print("\n📁 FILE OPERATIONS:")
+        lines.append("\n📁 FILE OPERATIONS:")
         total_ops = counters.get('total_file_operations', 0)
         allowed_ops = counters.get('file_operations_allowed', 0)
         blocked_ops = counters.get('file_operations_blocked', 0)
-        print(f"  Total: {total_ops}")
-        print(f"  Allowed: {allowed_ops}")
-        print(f"  Blocked: {blocked_ops}")
-        print(f"  Conflicts Prevented: {counters.get('conflict_preventions', 0)}")
+        lines.append(f"  Total: {total_ops}")
+        lines.append(f"  Allowed: {allowed_ops}")
+        lines.append(f"  Blocked: {blocked_ops}")
+        lines.append(f"  Conflicts Prevented: {counters.get('conflict_preventions', 0)}")
 
         # Success rate
         success_rate = self.collector.get_success_rate()
-        print(f"\n📈 SUCCESS RATE: {success_rate:.1%}")
+        lines.append(f"\n📈 SUCCESS RATE: {success_rate:.1%}")
 
         # Errors
         total_errors = counters.get('total_errors', 0)
         if total_errors > 0:
-            print(f"\n❌ ERRORS: {total_errors}")
-            for key, value in counters.items():
-                if key.startswith('error_'):
-                    error_type = key.replace('error_', '')
-                    print(f"  {error_type}: {value}")
+            lines.append(f"\n❌ ERRORS: {total_errors}")
+            for error_type, value in self.collector.error_counters.items():
+                lines.append(f"  {error_type}: {value}")
 
         # Recent events
-        print("\n📋 RECENT EVENTS:")
+        lines.append("\n📋 RECENT EVENTS:")
         for event in summary['recent_events'][-5:]:
-            timestamp = event['timestamp'].split('T')[1][:8]
+            timestamp = event['timestamp']
+            timestamp = timestamp.split('T')[1][:8] if timestamp else '--:--:--'
             event_type = event['event_type']
-            print(f"  [{timestamp}] {event_type}")
+            lines.append(f"  [{timestamp}] {event_type}")
+
+        lines.append("\n" + "=" * 80 + "\n")
 
-        print("\n" + "=" * 80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def generate_report(self, output_file: Optional[Path] = None) -> str:
         """
@@ -436,6 +639,10 @@ class AlertSystem:
             'success_rate': 0.8,  # 80% success rate
         }
 
+        # check_alerts() result, reused until the collector records an
+        # event or the thresholds change
+        self._checked_key: Optional[tuple] = None
+
     def check_alerts(self) -> List[Dict]:
         """
         Check for alert conditions
@@ -443,52 +650,50 @@ class AlertSystem:
         Returns:
             List of active alerts
         """
-        active_alerts = []
+        collector = self.collector
+        version, error_total, blocked_total = collector.totals()
+        key = (version, tuple(self.thresholds.items()))
+        if key == self._checked_key:
+            return self.alerts
 
-        summary = self.collector.get_summary()
-        counters = summary['counters']
+        counters = collector.counters
+        thresholds = self.thresholds
 
-        # Check error rate
         total = counters.get('total_routing_decisions', 0)
         if total > 0:
-            errors = counters.get('total_errors', 0)
-            error_rate = errors / total
-
-            if error_rate > self.thresholds['error_rate']:
-                active_alerts.append({
-                    'type': 'high_error_rate',
-                    'severity': 'warning',
-                    'message': f"Error rate is {error_rate:.1%} (threshold: {self.thresholds['error_rate']:.1%})",
-                    'value': error_rate,
-                })
-
-        # Check block rate
-        if total > 0:
-            blocked = (
+            inv_total = 1.0 / total
+            error_rate = error_total * inv_total
+            block_rate = (
                 counters.get('prerequisite_checks_failed', 0) +
                 counters.get('file_operations_blocked', 0)
-            )
-            block_rate = blocked / total
-
-            if block_rate > self.thresholds['block_rate']:
-                active_alerts.append({
-                    'type': 'high_block_rate',
-                    'severity': 'warning',
-                    'message': f"Block rate is {block_rate:.1%} (threshold: {self.thresholds['block_rate']:.1%})",
-                    'value': block_rate,
-                })
-
-        # Check success rate
-        success_rate = self.collector.get_success_rate()
-        if success_rate < self.thresholds['success_rate']:
-            active_alerts.append({
-                'type': 'low_success_rate',
-                'severity': 'critical',
-                'message': f"Success rate is {success_rate:.1%} (threshold: {self.thresholds['success_rate']:.1%})",
-                'value': success_rate,
-            })
-
+            ) * inv_total
+            # Same denominator as get_success_rate()
+            success_rate = 1.0 - blocked_total * inv_total
+        else:
+            error_rate = block_rate = 0.0
+            success_rate = 1.0
+
+        # (type, severity, label, value, threshold, breached)
+        checks = (
+            ('high_error_rate', 'warning', 'Error rate', error_rate,
+             thresholds['error_rate'], error_rate > thresholds['error_rate']),
+            ('high_block_rate', 'warning', 'Block rate', block_rate,
+             thresholds['block_rate'], block_rate > thresholds['block_rate']),
+            ('low_success_rate', 'critical', 'Success rate', success_rate,
+             thresholds['success_rate'], success_rate < thresholds['success_rate']),
+        )
+        active_alerts = [
+            {
+                'type': alert_type,
+                'severity': severity,
+                'message': f"{label} is {value:.1%} (threshold: {threshold:.1%})",
+                'value': value,
+            }
+            for alert_type, severity, label, value, threshold, breached in checks
+            if breached
+        ]
         self.alerts = active_alerts
+        self._checked_key = key
         return active_alerts
 
     def display_alerts(self):
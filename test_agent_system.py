@@ -5,44 +5,109 @@ Tests routing logic, prerequisite checks, completion verification,
 and conflict prevention.
 
 Installation:
-    pip install pytest pytest-cov
+    pip install pytest pytest-cov pytest-xdist
 
 Usage:
     pytest test_agent_system.py -v
     pytest test_agent_system.py -v --cov=. --cov-report=html
+    pytest test_agent_system.py -n auto   # parallel (pytest-xdist)
 """
 
+import json
+import os
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
+import threading
+import time
+from logging.handlers import QueueHandler
 
 from agent_router import (
     AgentRouter,
     RoutingMetrics,
     ForbiddenOperationError,
 )
-from main import AgentOrchestrator, AgentStatus
+from main import _LOG_LISTENER, AgentOrchestrator, AgentStatus, ExecutionResult
+from config import Config, ConfigDefaults
+from monitoring import AlertSystem, MetricsCollector
+
+# Status members compared by identity in assertions
+_RUNNING = AgentStatus.RUNNING
+_BLOCKED = AgentStatus.BLOCKED
+_COMPLETED = AgentStatus.COMPLETED
+
+
+def _fast_rmtree(path):
+    """Remove a test tree using the entry types scandir already reports"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+# Default UI foundation contents written by _make_ui_foundation
+_TYPES_TS = b"export interface Data {}"
+_API_TS = "🔌 INTEGRATION POINT\nexport async function getData() {}".encode("utf-8")
+
+
+def _make_ui_foundation(feature_path, api=_API_TS):
+    """Create types.ts, api.ts and components/ under feature_path"""
+    feature_path.mkdir(parents=True, exist_ok=True)
+    (feature_path / "types.ts").write_bytes(_TYPES_TS)
+    (feature_path / "api.ts").write_bytes(api)
+    (feature_path / "components").mkdir(exist_ok=True)
+
+
+def _context(path):
+    """Build a route_request context pointing at path"""
+    return {"current_path": os.fspath(path)}
+
+
+@pytest.fixture(scope="session")
+def _temp_root(tmp_path_factory):
+    """Create one temporary root shared by the whole session"""
+    return tmp_path_factory.mktemp("agent_tests")
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(_temp_root, request):
     """Create temporary directory for tests"""
-    temp = tempfile.mkdtemp()
-    yield Path(temp)
-    shutil.rmtree(temp)
+    temp = _temp_root / request.node.name
+    temp.mkdir()
+    yield temp
+    if temp.exists():
+        _fast_rmtree(temp)
 
 
 @pytest.fixture
-def router(temp_dir):
+def feature_path(temp_dir):
+    """Create the app/feature directory used by most file-based tests"""
+    path = temp_dir / "app" / "feature"
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture(scope="session")
+def _router():
+    """Create one AgentRouter shared by the whole session"""
+    return AgentRouter(base_path="/")
+
+
+@pytest.fixture
+def router(_router, temp_dir):
     """Create AgentRouter instance"""
-    return AgentRouter(base_path=str(temp_dir))
+    _router.reset(str(temp_dir))
+    return _router
 
 
 @pytest.fixture
 def orchestrator(temp_dir):
     """Create AgentOrchestrator instance"""
-    return AgentOrchestrator(base_path=str(temp_dir))
+    orchestrator = AgentOrchestrator(base_path=str(temp_dir))
+    yield orchestrator
+    orchestrator.shutdown()
 
 
 class TestRequestClassification:
@@ -68,6 +133,40 @@ class TestRequestClassification:
         result = router.classify_request("시간 거래 수정 기능 추가해줘")
         assert result == "modify_existing"
 
+    def test_needs_ui_changes(self, router):
+        """Test detection of UI change keywords"""
+        assert router.needs_ui_changes("버튼 색상 수정해줘") is True
+        assert router.needs_ui_changes("쿼리 성능 수정해줘") is False
+
+
+class TestFeaturePathExtraction:
+    """Test feature path extraction"""
+
+    def test_korean_feature_name_mapped(self, router, temp_dir):
+        """Test that Korean feature names map to directory names"""
+        result = router.extract_feature_path("시간 거래 기능 만들어줘", {})
+        assert result == temp_dir / "app" / "time-slots"
+
+    def test_app_path_in_message(self, router, temp_dir):
+        """Test that explicit app/ paths are extracted"""
+        result = router.extract_feature_path("app/my-feature 수정해줘", {})
+        assert result == temp_dir / "app" / "my-feature"
+
+    def test_app_path_preferred_over_earlier_feature_name(self, router, temp_dir):
+        """Test that app/ paths win even when a feature name appears first"""
+        result = router.extract_feature_path("로그인 화면을 app/sign-in 에 만들어줘", {})
+        assert result == temp_dir / "app" / "sign-in"
+
+    def test_context_path_takes_precedence(self, router):
+        """Test that current_path in context wins over the message"""
+        result = router.extract_feature_path("로그인 만들어줘", {"current_path": "app/other"})
+        assert result == Path("app/other")
+
+    def test_default_to_app_root(self, router, temp_dir):
+        """Test fallback to app root"""
+        result = router.extract_feature_path("뭔가 만들어줘", {})
+        assert result == temp_dir / "app"
+
 
 class TestRouting:
     """Test routing decision logic"""
@@ -76,7 +175,7 @@ class TestRouting:
         """Test that first feature request routes to UI agent"""
         result = router.route_request(
             "회원가입 기능 만들어줘",
-            {"current_path": str(temp_dir / "app" / "auth")}
+            _context(temp_dir / "app" / "auth")
         )
         assert result == "ui-implementer"
 
@@ -84,7 +183,7 @@ class TestRouting:
         """Test that backend request without UI is blocked"""
         result = router.route_request(
             "Supabase 인증 로직 구현해줘",
-            {"current_path": str(temp_dir / "app" / "auth")}
+            _context(temp_dir / "app" / "auth")
         )
         assert result == "error:missing_ui_foundation"
 
@@ -99,10 +198,57 @@ class TestRouting:
 
         result = router.route_request(
             "Supabase 연결해줘",
-            {"current_path": str(feature_path)}
+            _context(feature_path)
         )
         assert result == "feature-logic-implementer"
 
+    def test_ui_only_request_skips_filesystem_check(self, router, monkeypatch):
+        """Test that UI-only requests are routed without checking files"""
+        def fail(self, feature_path):
+            raise AssertionError("check_existing_files should not be called")
+
+        monkeypatch.setattr(AgentRouter, "check_existing_files", fail)
+
+        result = router.route_request("로그인 폼 UI만 만들어줘")
+        assert result == "ui-implementer"
+
+
+class TestExistingFilesCache:
+    """Test caching of feature directory existence checks"""
+
+    def test_cache_invalidated_when_directory_changes(self, router, feature_path):
+        """Test that adding a file (new mtime) refreshes cached flags"""
+        (feature_path / "components").mkdir()
+        os.utime(feature_path, ns=(0, 0))
+
+        assert router.check_existing_files(feature_path)["types_exists"] is False
+        assert os.fspath(feature_path) in router._fs_cache
+
+        (feature_path / "types.ts").write_bytes(_TYPES_TS)
+        os.utime(feature_path, ns=(10**9, 10**9))
+
+        assert router.check_existing_files(feature_path)["types_exists"] is True
+
+    def test_str_and_path_share_cache_entry(self, router, feature_path):
+        """Test that str feature paths are accepted and share the cache"""
+        _make_ui_foundation(feature_path)
+        os.utime(feature_path, ns=(0, 0))
+
+        assert router.verify_completion("ui-implementer", str(feature_path)) == (True, "")
+        assert os.fspath(feature_path) in router._fs_cache
+
+        router.before_create_file("ui-implementer", feature_path / "page.tsx")
+        assert os.fspath(feature_path) not in router._fs_cache
+
+    def test_missing_directory_not_cached(self, router, temp_dir):
+        """Test that missing directories report no files and are not cached"""
+        feature_path = temp_dir / "app" / "missing"
+
+        files = router.check_existing_files(feature_path)
+
+        assert files["ui_complete"] is False
+        assert os.fspath(feature_path) not in router._fs_cache
+
 
 class TestPrerequisiteChecks:
     """Test prerequisite verification"""
@@ -124,14 +270,10 @@ class TestPrerequisiteChecks:
         assert "Cannot run feature-logic-implementer" in error
         assert "types.ts" in error
 
-    def test_backend_agent_with_ui_foundation(self, router, temp_dir):
+    def test_backend_agent_with_ui_foundation(self, router, feature_path):
         """Test that backend agent can run with UI foundation"""
         # Create UI foundation
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
-        (feature_path / "types.ts").write_text("export interface Data {}")
-        (feature_path / "api.ts").write_text("🔌 INTEGRATION POINT\nexport async function getData() {}")
-        (feature_path / "components").mkdir()
+        _make_ui_foundation(feature_path)
 
         can_run, error = router.verify_prerequisites("feature-logic-implementer", feature_path)
 
@@ -142,49 +284,36 @@ class TestPrerequisiteChecks:
 class TestCompletionVerification:
     """Test completion verification"""
 
-    def test_ui_agent_incomplete_without_types(self, router, temp_dir):
-        """Test that UI agent cannot complete without types.ts"""
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
-        (feature_path / "components").mkdir()
-
-        is_complete, error = router.verify_completion("ui-implementer", feature_path)
-
-        assert is_complete is False
-        assert "types.ts" in error
-
-    def test_ui_agent_incomplete_without_api(self, router, temp_dir):
-        """Test that UI agent cannot complete without api.ts"""
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
-        (feature_path / "types.ts").write_text("export interface Data {}")
+    @pytest.mark.parametrize(
+        "files,expected,error_fragment",
+        [
+            ({}, False, "types.ts"),
+            ({"types.ts": _TYPES_TS}, False, "api.ts"),
+            (
+                {"types.ts": _TYPES_TS, "api.ts": b"export async function getData() {}"},
+                False,
+                "missing TODO markers",
+            ),
+            ({"types.ts": _TYPES_TS, "api.ts": _API_TS}, True, ""),
+        ],
+        ids=["without_types", "without_api", "without_todo_markers", "all_files"],
+    )
+    def test_ui_agent_completion(self, router, feature_path, files, expected, error_fragment):
+        """Test that UI agent completes only with all required files"""
         (feature_path / "components").mkdir()
+        for name, content in files.items():
+            (feature_path / name).write_bytes(content)
 
         is_complete, error = router.verify_completion("ui-implementer", feature_path)
 
-        assert is_complete is False
-        assert "api.ts" in error
+        assert is_complete is expected
+        assert error_fragment in error
 
-    def test_ui_agent_incomplete_without_todo_markers(self, router, temp_dir):
-        """Test that UI agent cannot complete without TODO markers in api.ts"""
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
-        (feature_path / "types.ts").write_text("export interface Data {}")
-        (feature_path / "api.ts").write_text("export async function getData() {}")
-        (feature_path / "components").mkdir()
-
-        is_complete, error = router.verify_completion("ui-implementer", feature_path)
-
-        assert is_complete is False
-        assert "missing TODO markers" in error
-
-    def test_ui_agent_complete_with_all_files(self, router, temp_dir):
-        """Test that UI agent can complete with all required files"""
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
-        (feature_path / "types.ts").write_text("export interface Data {}")
-        (feature_path / "api.ts").write_text("🔌 INTEGRATION POINT\nexport async function getData() {}")
-        (feature_path / "components").mkdir()
+    def test_todo_marker_found_in_large_api_file(self, router, feature_path):
+        """Test that the TODO marker is found in api.ts files scanned via mmap"""
+        # Larger than the router's mmap threshold, marker at the very end
+        large_api = b"// padding\n" * 200_000 + "🔌 INTEGRATION POINT\n".encode("utf-8")
+        _make_ui_foundation(feature_path, api=large_api)
 
         is_complete, error = router.verify_completion("ui-implementer", feature_path)
 
@@ -194,16 +323,22 @@ class TestCompletionVerification:
 class TestConflictPrevention:
     """Test conflict prevention rules"""
 
-    def test_backend_cannot_create_api_ts(self, router, temp_dir):
+    def test_backend_cannot_create_api_ts(self, router, feature_path):
         """Test that backend agent cannot create api.ts"""
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
         api_file = feature_path / "api.ts"
         api_file.write_text("existing content")
 
         with pytest.raises(ForbiddenOperationError):
             router.before_create_file("feature-logic-implementer", api_file)
 
+    def test_ui_can_recreate_api_ts(self, router, feature_path):
+        """Test that only backend agent is blocked from recreating api.ts"""
+        api_file = feature_path / "api.ts"
+        api_file.write_bytes(_API_TS)
+
+        # Should not raise
+        router.before_create_file("ui-implementer", api_file)
+
     def test_backend_can_create_service_files(self, router, temp_dir):
         """Test that backend agent can create service files"""
         service_file = temp_dir / "lib" / "services" / "timeSlotService.ts"
@@ -225,6 +360,18 @@ class TestConflictPrevention:
         with pytest.raises(ForbiddenOperationError):
             router.before_modify_file("feature-logic-implementer", page_file)
 
+    def test_backend_cannot_modify_windows_style_component_path(self, router):
+        """Test that backslash-separated component paths are also protected"""
+        with pytest.raises(ForbiddenOperationError):
+            router.before_modify_file("feature-logic-implementer", Path("app\\feature\\components\\Form.tsx"))
+
+    def test_backend_can_modify_actions_ts(self, router, temp_dir):
+        """Test that backend agent can modify non-UI files in a feature"""
+        actions_file = temp_dir / "app" / "feature" / "actions.ts"
+
+        # Should not raise
+        router.before_modify_file("feature-logic-implementer", actions_file)
+
     def test_ui_can_modify_components(self, router, temp_dir):
         """Test that UI agent can modify components"""
         component_file = temp_dir / "app" / "feature" / "components" / "Form.tsx"
@@ -285,6 +432,24 @@ export async function createData(data: CreateDTO): Promise<Data> {
         with pytest.raises(ForbiddenOperationError):
             router.verify_api_signature_unchanged(original, modified)
 
+    def test_dollar_function_names_extracted(self, router):
+        """Test that identifiers containing $ are matched whole"""
+        content = "export async function get$Slots(id: string): Promise<Slot[]> {}"
+
+        signatures = router._extract_function_signatures(content)
+
+        assert list(signatures) == ["get$Slots"]
+
+    def test_signature_cache_distinguishes_lone_surrogates(self, router):
+        """Test content differing only by a lone surrogate is not a cache hit"""
+        plain = "export async function f(a: T): Promise<X> {}"
+        surrogate = "export async function f(a\ud800: T): Promise<X> {}"
+
+        router._extract_function_signatures(plain)
+        signatures = router._extract_function_signatures(surrogate)
+
+        assert "\ud800" in signatures["f"]
+
 
 class TestMetrics:
     """Test metrics tracking"""
@@ -319,6 +484,23 @@ class TestMetrics:
         metrics.record_block("file_conflicts")
         assert metrics.metrics['blocked_file_conflicts'] == 1
 
+    def test_concurrent_record_route(self):
+        """Test that concurrent increments are not lost"""
+        metrics = RoutingMetrics()
+
+        def worker():
+            for _ in range(1000):
+                metrics.record_route("ui-implementer")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.metrics['total_requests'] == 8000
+        assert metrics.metrics['routed_to_ui'] == 8000
+
     def test_success_rate_calculation(self):
         """Test success rate calculation"""
         metrics = RoutingMetrics()
@@ -334,6 +516,17 @@ class TestMetrics:
         success_rate = metrics.get_success_rate()
         assert success_rate == 0.8  # 8/10
 
+    def test_snapshot_matches_separate_reads(self):
+        """Test snapshot returns metrics and success rate together"""
+        metrics = RoutingMetrics()
+        metrics.record_route("feature-logic-implementer")
+        metrics.record_block("file_conflicts")
+
+        counts, success_rate = metrics.snapshot()
+
+        assert counts == metrics.get_metrics()
+        assert success_rate == metrics.get_success_rate() == 0.0
+
 
 class TestOrchestrator:
     """Test orchestrator functionality"""
@@ -343,38 +536,54 @@ class TestOrchestrator:
         result = orchestrator.process_request("시간 거래 UI 만들어줘")
 
         assert result.agent == "ui-implementer"
-        assert result.status == AgentStatus.RUNNING
+        assert result.status is _RUNNING
+
+    def test_orchestrators_share_logging_listener(self, orchestrator, temp_dir):
+        """Test a second orchestrator leaves the first one's log file attached"""
+        other_dir = temp_dir / "other"
+        other_dir.mkdir()
+        successor = AgentOrchestrator(base_path=str(other_dir))
+        try:
+            assert orchestrator._log_handler in _LOG_LISTENER.handlers
+            assert successor._log_handler in _LOG_LISTENER.handlers
+            queue_handlers = [
+                h for h in orchestrator.logger.handlers if isinstance(h, QueueHandler)
+            ]
+            assert len(queue_handlers) == 1
+        finally:
+            successor.shutdown()
+
+        orchestrator.logger.info("still logging")
+        orchestrator.shutdown()
+
+        assert _LOG_LISTENER._thread is not None
+        assert "still logging" in (temp_dir / "agent_orchestrator.log").read_text("utf-8")
+        assert not (other_dir / "agent_orchestrator.log").exists()
 
     def test_process_backend_without_ui_blocked(self, orchestrator):
         """Test processing backend request without UI"""
         result = orchestrator.process_request("Supabase 구현해줘")
 
-        assert result.status == AgentStatus.BLOCKED
+        assert result.status is _BLOCKED
         assert "UI foundation not found" in result.message
 
-    def test_verify_completion_success(self, orchestrator, temp_dir):
+    def test_verify_completion_success(self, orchestrator, feature_path):
         """Test successful completion verification"""
         # Create complete UI foundation
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
-        (feature_path / "types.ts").write_text("export interface Data {}")
-        (feature_path / "api.ts").write_text("🔌 INTEGRATION POINT\nexport async function getData() {}")
-        (feature_path / "components").mkdir()
+        _make_ui_foundation(feature_path)
 
         result = orchestrator.verify_agent_completion("ui-implementer", feature_path)
 
-        assert result.status == AgentStatus.COMPLETED
+        assert result.status is _COMPLETED
 
-    def test_verify_completion_failure(self, orchestrator, temp_dir):
+    def test_verify_completion_failure(self, orchestrator, feature_path):
         """Test failed completion verification"""
         # Incomplete foundation
-        feature_path = temp_dir / "app" / "feature"
-        feature_path.mkdir(parents=True)
-        (feature_path / "types.ts").write_text("export interface Data {}")
+        (feature_path / "types.ts").write_bytes(_TYPES_TS)
 
         result = orchestrator.verify_agent_completion("ui-implementer", feature_path)
 
-        assert result.status == AgentStatus.BLOCKED
+        assert result.status is _BLOCKED
 
     def test_check_file_operation_allowed(self, orchestrator, temp_dir):
         """Test allowed file operation"""
@@ -401,6 +610,299 @@ class TestOrchestrator:
         assert error is not None
         assert "FORBIDDEN" in error
 
+    def test_concurrent_requests_all_recorded(self, orchestrator):
+        """Test that concurrent requests each land in the history once"""
+        def worker():
+            for _ in range(50):
+                orchestrator.process_request("시간 거래 UI 만들어줘")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = orchestrator.get_metrics()
+        assert metrics["total_executions"] == 200
+        assert len(metrics["history"]) == 10
+
+    def test_result_dicts_are_independent(self):
+        """Test that modifying one to_dict() result leaves later ones intact"""
+        result = ExecutionResult("ui-implementer", AgentStatus.COMPLETED, "UI done")
+
+        exported = result.to_dict()
+        exported["message"] = "changed"
+
+        assert result.to_dict()["message"] == "UI done"
+        assert result.to_dict()["files_created"] == ()
+        assert result.to_dict() is not result.to_dict()
+
+    def test_metrics_preview_keeps_last_results(self, orchestrator):
+        """Test results are recorded and only the latest show in metrics"""
+        for i in range(12):
+            orchestrator.process_request(f"시간 거래 UI 만들어줘 {i}", {})
+
+        metrics = orchestrator.get_metrics()
+
+        assert metrics["total_executions"] == 12
+        assert len(metrics["history"]) == 10
+        assert orchestrator.history[0]._timestamp is None  # not formatted by recording
+        assert metrics["history"][-1] == orchestrator.history[-1].to_dict()
+
+    def test_replay_cache_keeps_metrics(self, temp_dir):
+        """Test replayed results are counted like processed ones"""
+        messages = ["시간 거래 Supabase 연결해줘", "시간 거래 UI 만들어줘"] * 2
+        cached = AgentOrchestrator(base_path=str(temp_dir), replay_cache=True)
+        try:
+            replayed = [cached.process_request(m) for m in messages]
+            cached_metrics = cached.get_metrics(include_history=False)
+        finally:
+            cached.shutdown()
+        uncached = AgentOrchestrator(base_path=str(temp_dir))
+        try:
+            for m in messages:
+                uncached.process_request(m)
+            uncached_metrics = uncached.get_metrics(include_history=False)
+        finally:
+            uncached.shutdown()
+
+        assert replayed[2] is not replayed[0]
+        assert replayed[2].to_dict()["message"] == replayed[0].message
+        assert cached_metrics == uncached_metrics
+        assert cached_metrics["total_executions"] == 4
+
+    def test_replay_cache_revalidates_feature_files(self, orchestrator, temp_dir):
+        """Test repeated requests replay until the feature files change"""
+        orchestrator.replay_cache_enabled = True
+        message = "시간 거래 Supabase 연결해줘"
+
+        first = orchestrator.process_request(message)
+        replayed = orchestrator.process_request(message)
+        assert replayed is not first
+        assert (replayed.agent, replayed.status) == (first.agent, first.status)
+        assert first.status is _BLOCKED
+        assert orchestrator._replay_cache[(message, frozenset())][0] is first
+
+        feature_path = temp_dir / "app" / "time-slots"
+        _make_ui_foundation(feature_path)
+
+        result = orchestrator.process_request(message)
+
+        assert result is not first
+        assert result.agent == "feature-logic-implementer"
+        assert result.status is _RUNNING
+
+    def test_replay_cache_revalidates_router_flags(self, orchestrator):
+        """Test toggling a router flag forces the request to be reprocessed"""
+        orchestrator.replay_cache_enabled = True
+        message = "시간 거래 Supabase 연결해줘"
+
+        key = (message, frozenset())
+
+        first = orchestrator.process_request(message)
+        orchestrator.process_request(message)
+        assert orchestrator._replay_cache[key][0] is first
+
+        orchestrator.router.verify_prerequisites_enabled = False
+        result = orchestrator.process_request(message)
+
+        # Reprocessed, so the cache now holds the new result
+        assert orchestrator._replay_cache[key][0] is result
+        assert orchestrator.get_metrics()["total_executions"] == 3
+
+    def test_export_history_ndjson(self, orchestrator, temp_dir):
+        """Test NDJSON export writes one record per line"""
+        orchestrator.history = [
+            ExecutionResult("ui-implementer", AgentStatus.COMPLETED, "UI done"),
+            ExecutionResult("feature-logic-implementer", AgentStatus.BLOCKED, "Blocked"),
+        ]
+        output_file = temp_dir / "history.ndjson"
+
+        exported = orchestrator.export_history(output_file)
+
+        assert exported == output_file.read_text(encoding="utf-8")
+        lines = exported.splitlines()
+        assert len(lines) == 2
+        assert [json.loads(line)["status"] for line in lines] == ["completed", "blocked"]
+
+
+class TestMonitoring:
+    """Test monitoring metrics collection"""
+
+    def test_event_timestamps_formatted_on_read(self, temp_dir):
+        """Test raw event timestamps come out as ISO strings"""
+        collector = MetricsCollector()
+        collector.record_routing_decision("ui-implementer", "full_feature", 12.5)
+        collector.record_error("RoutingError", "boom")
+        output_file = temp_dir / "metrics.json"
+
+        collector.export_metrics(output_file)
+
+        recent = collector.get_summary()["recent_events"]
+        exported = json.loads(output_file.read_text())
+        assert recent[0]["timestamp"] == exported["history"][0]["timestamp"]
+        assert "T" in exported["errors"]["RoutingError"][0]["timestamp"]
+        assert isinstance(collector.event_history[0].timestamp, float)
+
+    def test_timing_aggregates(self):
+        """Test timing summary is kept as running aggregates"""
+        collector = MetricsCollector()
+        for duration in (10.0, 8.0, 21.0):
+            collector.record_routing_decision("ui-implementer", "full_feature", duration)
+        collector.record_routing_decision("ui-implementer", "full_feature")
+
+        timing = collector.get_summary()["timings"]["routing_decision"]
+
+        assert timing == {"count": 3, "avg_ms": 13.0, "min_ms": 8.0, "max_ms": 21.0}
+
+    def test_recent_events_are_newest_in_order(self):
+        """Test recent_events holds the last events, oldest first"""
+        collector = MetricsCollector()
+        for i in range(15):
+            collector.record_routing_decision("ui-implementer", "full_feature", float(i))
+
+        recent = collector.get_summary()["recent_events"]
+
+        assert [e["duration_ms"] for e in recent] == [float(i) for i in range(5, 15)]
+
+    def test_fixed_counters_pre_seeded(self):
+        """Test fixed totals are reported as zero before any event"""
+        counters = MetricsCollector().get_summary()["counters"]
+
+        assert counters["total_routing_decisions"] == 0
+        assert counters["file_operations_blocked"] == 0
+
+    def test_counters_by_kind_flattened_in_summary(self):
+        """Test per-name counters are nested by kind and flattened on read"""
+        collector = MetricsCollector()
+        collector.record_routing_decision("ui-implementer", "full_feature")
+        collector.record_error("RoutingError", "boom")
+
+        assert collector.counters_by_kind["routed_to"] == {"ui-implementer": 1}
+        counters = collector.get_summary()["counters"]
+        assert counters["routed_to_ui-implementer"] == 1
+        assert counters["request_type_full_feature"] == 1
+        assert counters["error_RoutingError"] == 1
+
+    def test_summary_reused_until_next_event(self):
+        """Test get_summary only rebuilds after a new event"""
+        collector = MetricsCollector()
+        collector.record_routing_decision("ui-implementer", "full_feature")
+
+        first = collector.get_summary()
+        assert collector.get_summary()["counters"] is first["counters"]
+
+        collector.record_prerequisite_check("ui-implementer", True)
+        second = collector.get_summary()
+
+        assert second["counters"] is not first["counters"]
+        assert second["counters"]["total_prerequisite_checks"] == 1
+
+    def test_batch_routing_decisions_match_single_records(self):
+        """Test batch ingestion counts the same as one call per decision"""
+        decisions = [
+            ("ui-implementer", "full_feature", 10.0),
+            ("feature-logic-implementer", "backend_only", None),
+            ("ui-implementer", "ui_only", 4.0),
+        ]
+        single = MetricsCollector()
+        for decision in decisions:
+            single.record_routing_decision(*decision)
+        batch = MetricsCollector()
+
+        batch.record_routing_decisions(decisions)
+
+        single_summary, batch_summary = single.get_summary(), batch.get_summary()
+        assert batch_summary["counters"] == single_summary["counters"]
+        assert batch_summary["timings"] == single_summary["timings"]
+        assert len(batch.event_history) == 3
+
+    def test_timestamp_modes(self):
+        """Test exact timestamps are current and "none" stores no time"""
+        exact = MetricsCollector(timestamp_mode="exact")
+        untimed = MetricsCollector(timestamp_mode="none")
+
+        exact.record_routing_decision("ui-implementer", "full_feature")
+        untimed.record_routing_decision("ui-implementer", "full_feature")
+
+        assert abs(exact.event_history[0].timestamp - time.time()) < 1.0
+        assert untimed.get_summary()["recent_events"][0]["timestamp"] is None
+        with pytest.raises(ValueError):
+            MetricsCollector(timestamp_mode="coarse")
+
+    def test_totals_track_errors_and_blocks(self):
+        """Test totals() reports a new version and counts per event"""
+        collector = MetricsCollector()
+        version = collector.totals()[0]
+
+        collector.record_prerequisite_check("feature-logic-implementer", False)
+        collector.record_error("RoutingError", "boom")
+
+        new_version, errors, blocked = collector.totals()
+        assert new_version != version
+        assert (errors, blocked) == (1, 1)
+
+    def test_alerts_rechecked_only_on_change(self):
+        """Test check_alerts reuses its result until events or thresholds change"""
+        collector = MetricsCollector()
+        alerts = AlertSystem(collector)
+        collector.record_routing_decision("ui-implementer", "full_feature")
+
+        first = alerts.check_alerts()
+        assert first == []
+        assert alerts.check_alerts() is first
+
+        collector.record_error("RoutingError", "boom")
+        assert [a["type"] for a in alerts.check_alerts()] == ["high_error_rate"]
+
+        alerts.thresholds["error_rate"] = 1.0
+        assert alerts.check_alerts() == []
+
+
+class TestConfig:
+    """Test configuration defaults and overrides"""
+
+    def test_slotted_instances_and_class_defaults(self):
+        """Test that instances are slotted and defaults live on ConfigDefaults"""
+        config = Config()
+        config.ENFORCE_UI_FIRST = False
+
+        assert ConfigDefaults.ENFORCE_UI_FIRST is True
+        assert config.ENFORCE_UI_FIRST is False
+        assert type(config) is Config
+        assert not hasattr(config, "__dict__")
+
+    def test_load_returns_independent_instances(self, monkeypatch):
+        """Test that load() instances share no overrides and track the env"""
+        first = Config.load()
+        first.ENFORCE_UI_FIRST = False
+        monkeypatch.setenv("API_PORT", "9100")
+
+        second = Config.load()
+
+        assert second.ENFORCE_UI_FIRST is True
+        assert second.API_PORT == 9100
+
+    def test_load_ignores_unknown_file_keys(self, temp_dir):
+        """Test that only config values are applied from a config file"""
+        config_file = temp_dir / "config.json"
+        config_file.write_text(json.dumps({"match_ui": 1, "API_PORT": 9000}))
+
+        config = Config.load(config_file)
+
+        assert config.API_PORT == 9000
+        assert callable(config.match_ui)
+
+    def test_keyword_patterns_follow_assignment(self):
+        """Test that assigning a keyword list recompiles its pattern"""
+        config = Config()
+        assert config.match_ui("로그인 폼")
+
+        config.UI_KEYWORDS = ["대시보드"]
+
+        assert not config.match_ui("로그인 폼")
+        assert config.match_ui("대시보드 화면")
+
 
 class TestIntegrationScenarios:
     """Test complete workflow scenarios"""
@@ -411,7 +913,7 @@ class TestIntegrationScenarios:
         # Step 1: User requests full feature
         result1 = orchestrator.process_request("시간 거래 기능 만들어줘")
         assert result1.agent == "ui-implementer"
-        assert result1.status == AgentStatus.RUNNING
+        assert result1.status is _RUNNING
 
         # Step 2: UI agent creates foundation
         feature_path = temp_dir / "app" / "time-slots"
@@ -422,22 +924,22 @@ class TestIntegrationScenarios:
 
         # Step 3: Verify UI completion
         result2 = orchestrator.verify_agent_completion("ui-implementer", feature_path)
-        assert result2.status == AgentStatus.COMPLETED
+        assert result2.status is _COMPLETED
 
         # Step 4: User requests backend
         result3 = orchestrator.process_request(
             "이제 실제로 작동하게 해줘",
-            {"current_path": str(feature_path)}
+            _context(feature_path)
         )
         assert result3.agent == "feature-logic-implementer"
-        assert result3.status == AgentStatus.RUNNING
+        assert result3.status is _RUNNING
 
     def test_backend_first_blocked(self, orchestrator):
         """Test that backend-first approach is blocked"""
 
         result = orchestrator.process_request("Supabase 인증 로직 구현해줘")
 
-        assert result.status == AgentStatus.BLOCKED
+        assert result.status is _BLOCKED
         assert "UI foundation not found" in result.message
 
 